@@ -9,7 +9,7 @@ from .validate_n_convert import Converter, ConversionError, DetailedConversionRe
 from .init_makers import inject_fields, make_init, init_fields
 from .helpers import copy_value, copy_field, copy_attr, has_fields, get_fields, yield_fields, get_field, \
     get_field_values
-from .autofields_ import autofields, autoclass
+from .autofields_ import autofields, autoclass, autoslots
 
 try:
     # Distribution mode : import from _version.py generated by setuptools_scm during release
@@ -31,5 +31,5 @@ __all__ = [
     'inject_fields', 'make_init', 'init_fields',
     'copy_value', 'copy_field', 'copy_attr', 'has_fields', 'get_fields', 'yield_fields', 'get_field',
     'get_field_values',
-    'autofields', 'autoclass'
+    'autofields', 'autoclass', 'autoslots'
 ]
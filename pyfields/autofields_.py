@@ -15,7 +15,7 @@ except ImportError:
 
 from .core import Field, field
 from .init_makers import make_init as mkinit
-from .helpers import copy_value, get_fields
+from .helpers import copy_value, get_fields, _is_plain_data
 
 
 PY36 = sys.version_info >= (3, 6)
@@ -205,12 +205,14 @@ def autofields(check_types=False,         # type: Union[bool, DecoratedClass]
                     new_field = field(check_type=need_to_check_type)
                 else:
                     # optional field : copy the default value by default
-                    try:
-                        # autocheck: make sure that we will be able to create copies later
-                        deepcopy(default_value)
-                    except Exception as e:
-                        raise ValueError("The provided default value for field %r=%r can not be deep-copied: "
-                                         "caught error %r" % (member_name, default_value, e))
+                    if not _is_plain_data(default_value):
+                        # builtin values and containers can always be copied: only check the others
+                        try:
+                            # autocheck: make sure that we will be able to create copies later
+                            deepcopy(default_value)
+                        except Exception as e:
+                            raise ValueError("The provided default value for field %r=%r can not be deep-copied: "
+                                             "caught error %r" % (member_name, default_value, e))
                     new_field = field(check_type=need_to_check_type,
                                       default_factory=copy_value(default_value, autocheck=False))
 
@@ -231,6 +233,9 @@ def autofields(check_types=False,         # type: Union[bool, DecoratedClass]
     # end of _autofields(cls)
 
     # Main logic of autofield(**kwargs)
+    # build the set of excluded names once here rather than for each member of each decorated class
+    exclude = frozenset((exclude,)) if isinstance(exclude, str) else frozenset(exclude)
+
     if check_types is not True and check_types is not False and isinstance(check_types, type):
         # called without arguments @autofields: check_types is the decorated class
         assert include_upper is False
@@ -244,13 +249,128 @@ def autofields(check_types=False,         # type: Union[bool, DecoratedClass]
         return _autofields
 
 
+def autoslots(cls  # type: DecoratedClass
+              ):
+    # type: (...) -> DecoratedClass
+    """
+    Decorator to add `__slots__` to a class, for the private attributes where its fields store their values.
+
+    Since `__slots__` can not be added to an existing class, a new class is created with the same name, bases and
+    members. Field values are stored in slots, and instances have no `__dict__` (unless an ancestor provides one): this
+    saves memory and makes accesses faster. All fields on the resulting class are descriptor fields (see `field`).
+    Weak references to instances are still supported if they were before.
+
+    >>> import sys, pytest
+    >>> if sys.version_info < (3, 6): pytest.skip("doctest skipped for python < 3.6")
+    ...
+    >>> @autoslots
+    ... class Pocket:
+    ...     size: int = field()
+    ...     items = field(default_factory=lambda obj: [])
+    ...
+    >>> Pocket.__slots__
+    ('_size', '_items', '__weakref__')
+    >>> p = Pocket()
+    >>> p.items
+    []
+    >>> hasattr(p, '__dict__')
+    False
+
+    Only the fields defined in the class itself are taken into account. Inherited fields are stored in slots only if
+    the ancestors are decorated too. Note that in python < 3.7, methods of the decorated class can not use `super()`
+    without arguments.
+
+    :param cls: the class to decorate
+    :return: a new class with `__slots__`
+    """
+    if '__slots__' in vars(cls):
+        raise ValueError("@autoslots can not be used on class %s: it already defines `__slots__`" % cls)
+
+    # python < 3.6: fields do not know their name yet
+    own_fields = get_fields(cls, include_inherited=False, _auto_fix_fields=not PY36)
+    slots = tuple("_" + f.name for f in own_fields)
+    if '__weakref__' in vars(cls):
+        # preserve weak references support
+        slots += ('__weakref__', )
+
+    # create the new class. Note: in python 3.6+ this calls `__set_name__` on all members, so fields are updated
+    cls_dict = dict(vars(cls))
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = slots
+    try:
+        cls_dict['__qualname__'] = cls.__qualname__
+    except AttributeError:
+        pass  # python 2
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+    # the private names of name-mangled fields (e.g. `__x` in class `B` > `__B__x`) are mangled again in `__slots__`
+    # (`_B__B__x`): expose their slot under the private name used by the fields too
+    for slot in slots:
+        mangled = _mangle(cls.__name__, slot)
+        if mangled != slot:
+            setattr(new_cls, slot, vars(new_cls)[mangled])
+
+    if not PY36:
+        # attach all fields to the new class explicitly
+        get_fields(new_cls, include_inherited=False, _auto_fix_fields=True)
+
+    # methods using `super()` without arguments refer to the original class in their `__class__` cell
+    for member in cls_dict.values():
+        _replace_class_cell(member, cls, new_cls)
+
+    return new_cls
+
+
+def _mangle(cls_name, name):
+    """
+    Returns `name` as mangled by python in class `cls_name`: private names (starting with two underscores and not
+    ending with two underscores) are prefixed with the class name.
+    """
+    stripped_cls_name = cls_name.lstrip('_')
+    if name.startswith('__') and not name.endswith('__') and stripped_cls_name:
+        return "_%s%s" % (stripped_cls_name, name)
+    else:
+        return name
+
+
+def _replace_class_cell(member, old_cls, new_cls):
+    """
+    Replaces `old_cls` with `new_cls` in the `__class__` closure cell of `member` if it is a function, or in the
+    functions it wraps if it is a classmethod, staticmethod or property.
+    """
+    if isinstance(member, (classmethod, staticmethod)):
+        funcs = (member.__func__, )
+    elif isinstance(member, property):
+        funcs = (member.fget, member.fset, member.fdel)
+    else:
+        funcs = (member, )
+
+    for f in funcs:
+        try:
+            freevars, closure = f.__code__.co_freevars, f.__closure__
+        except AttributeError:
+            continue
+        for name, cell in zip(freevars, closure or ()):
+            if name == '__class__' and cell.cell_contents is old_cls:
+                try:
+                    cell.cell_contents = new_cls
+                except AttributeError:
+                    # python < 3.7: cells are read-only, `super()` without arguments will not work
+                    pass
+
+
 def is_dunder(name):
     return len(name) >= 4 and name.startswith('__') and name.endswith('__')
 
 
 def is_reserved_dunder(name):
-    return name in ('__doc__', '__name__', '__qualname__', '__module__', '__code__', '__globals__',
-                    '__dict__', '__closure__', '__annotations__')  # '__defaults__', '__kwdefaults__')
+    return name in _RESERVED_DUNDERS
+
+
+_RESERVED_DUNDERS = frozenset(('__doc__', '__name__', '__qualname__', '__module__', '__code__', '__globals__',
+                               '__dict__', '__closure__', '__annotations__'))  # '__defaults__', '__kwdefaults__')
+"""The dunder names that are never transformed into fields, see `is_reserved_dunder`"""
 
 
 _dict, _hash = dict, hash
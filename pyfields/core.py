@@ -6,6 +6,13 @@ import sys
 from enum import Enum
 from textwrap import dedent
 from inspect import getmro
+from types import MemberDescriptorType
+from weakref import WeakKeyDictionary
+
+try:  # python 3+
+    from sys import intern
+except ImportError:  # python 2: intern is a builtin
+    pass
 
 try:
     from inspect import signature, Parameter
@@ -16,7 +23,8 @@ except ImportError:
 from valid8 import ValidationFailure, is_pep484_nonable
 
 from pyfields.typing_utils import assert_is_of_type, FieldTypeError, get_type_hints
-from pyfields.validate_n_convert import FieldValidator, make_converters_list, trace_convert
+from pyfields.validate_n_convert import FieldValidator, make_converters_list, trace_convert, accepts_all_values, \
+    get_base_callable
 
 try:  # python 3.5+
     # noinspection PyUnresolvedReferences
@@ -141,7 +149,7 @@ class Field(object):
     Base class for fields
     """
     __slots__ = ('__weakref__', 'is_mandatory', 'default', 'is_default_factory', 'name', 'type_hint', 'nonable', 'doc',
-                 'owner_cls', 'pending_validators', 'pending_converters')
+                 'owner_cls', 'pending_validators', 'pending_converters', '_needs_fixup')
     if not PY36:
         # we need to count the instances created, so as to be able to track their order in classes
         # indeed in python < 3.6, class members are not sorted by order of appearance.
@@ -190,6 +198,9 @@ class Field(object):
         else:
             self.type_hint = EMPTY
 
+        # True as long as `set_as_cls_member` has to be called (again), see `fix_field`
+        self._needs_fixup = name is None or self.type_hint is DELAYED
+
         # nonable
         if nonable is GUESS:
             if self.default is None:
@@ -272,6 +283,9 @@ class Field(object):
                     else:
                         self.nonable = UNKNOWN
 
+        # the name is now known, but type hints might still need to be resolved later
+        self._needs_fixup = self.type_hint is DELAYED
+
         # detect a validator or a converter on a native field
         if self.pending_validators is not None or self.pending_converters is not None:
             # create a descriptor field to replace this native field
@@ -816,7 +830,7 @@ class NativeField(Field):
 
         # do this first, because a field might be referenced from its class the first time it will be used
         # for example if in `make_init` we use a field defined in another class, that was not yet accessed on instance.
-        if self.name is None or self.type_hint is DELAYED:
+        if self._needs_fixup:
             # __set_name__ was not called yet. lazy-fix the name and type hints
             fix_field(obj_type, self)
 
@@ -878,11 +892,40 @@ _NO_BUT_CAN_CACHE_FIRST_RESULT = False
 _YES = True
 
 
+class _CopyValue(object):
+    """
+    Base class for the default value factories returned by `copy_value`. A callable class is used rather than a
+    closure, so that `val` is read from a slot and not from a closure cell.
+
+    It is defined here so that `DescriptorField` can detect such factories: subclasses implement `__call__`, and
+    `clone_with_new_val(newval)` to create a factory of the same kind with a new value, for example with the converted
+    version of the default value.
+    """
+    __slots__ = ('val', )
+
+    def __init__(self, val):
+        self.val = val
+
+    def get_copied_value(self):
+        return self.val
+
+
+_field_type_hint_slot = Field.type_hint
+"""The descriptor of the `type_hint` slot of `Field`, overridden by a property in `DescriptorField`"""
+
+_field_default_slot = Field.default
+"""The descriptor of the `default` slot of `Field`, overridden by a property in `DescriptorField`"""
+
+_field_nonable_slot = Field.nonable
+"""The descriptor of the `nonable` slot of `Field`, overridden by a property in `DescriptorField`"""
+
+
 class DescriptorField(Field):
     """
     General-purpose implementation for fields that require type-checking or validation or converter
     """
-    __slots__ = 'root_validator', 'check_type', 'converters', 'read_only', '_default_is_safe'
+    __slots__ = 'root_validator', '_check_type', 'converters', '_read_only', '_default_is_safe', \
+                '_get_default', '_get_default_or_raise', '_private_name', '_use_dict', '_do_set'
 
     @classmethod
     def create_from_field(cls,
@@ -912,6 +955,7 @@ class DescriptorField(Field):
 
         # copy the owner class info too
         new_field.owner_cls = other_field.owner_cls
+        new_field._compile_setter()
         return new_field
 
     def __init__(self,
@@ -931,7 +975,7 @@ class DescriptorField(Field):
                                               default=default, default_factory=default_factory, doc=doc, name=name)
 
         # type validation
-        self.check_type = check_type
+        self._check_type = check_type
 
         # validators
         if validators is not None:
@@ -946,30 +990,87 @@ class DescriptorField(Field):
             self.converters = None
 
         # read-only
-        self.read_only = read_only
+        self._read_only = read_only
+
+        # the name of the attribute where the value is actually stored on instances
+        self._private_name = intern("_" + name) if name is not None else None
 
+        # the functions used to get the default value
+        self._init_default_getters()
+
+        # the specialized setter
+        self._compile_setter()
+
+    def _init_default_getters(self):
+        """
+        Sets `self._default_is_safe`, `self._get_default` and `self._get_default_or_raise` according to the current
+        default value or default factory. This should be called again everytime they change.
+        """
         # self._default_is_safe is used to know if we should validate/convert the default value before use
         #  - None means "always". This is the case when there is a default factory we can't modify
         #  - False means "once", and then True means "not anymore" (after first validation). This is the case
         #    when we can modify the default value so that we can replace it with the possibly converted one
-        if default is not EMPTY:
+        if self.is_mandatory:
+            # no default at all
+            self._default_is_safe = _NO
+        elif not self.is_default_factory:
             # a fixed default value is here, we'll validate it once and for all
             self._default_is_safe = _NO_BUT_CAN_CACHE_FIRST_RESULT
-        elif default_factory is not None:
-            # noinspection PyBroadException
-            try:
-                # is this the `copy_value` factory ?
-                default_factory.clone_with_new_val
-            except Exception:
-                # No: the factory can be anything else
-                self._default_is_safe = _NO
-            else:
-                # Yes: we can replace the value that it uses on first
-                self._default_is_safe = _NO_BUT_CAN_CACHE_FIRST_RESULT
+        elif isinstance(self.default, _CopyValue):
+            # the `copy_value` factory: we can replace the value that it uses on first
+            self._default_is_safe = _NO_BUT_CAN_CACHE_FIRST_RESULT
         else:
-            # no default at all
+            # the factory can be anything else
             self._default_is_safe = _NO
 
+        # the function used in `__get__` on first read, depending on `_default_is_safe`
+        if self._default_is_safe is _NO:
+            self._get_default = self._get_default_validated
+        else:
+            self._get_default = self._get_default_validated_once
+
+        self._init_get_default_or_raise()
+
+    def _init_get_default_or_raise(self):
+        """
+        Sets `self._get_default_or_raise`, the function with signature `(obj)` returning the default value to use for
+        `obj`, or raising an error if the field is mandatory.
+        """
+        if self.is_mandatory:
+            def get_default_or_raise(obj):
+                raise MandatoryFieldInitError(self.name, obj)
+        elif self.is_default_factory:
+            # the factory already has the appropriate signature
+            get_default_or_raise = self.default
+        else:
+            default = self.default
+
+            def get_default_or_raise(obj):
+                return default
+
+        self._get_default_or_raise = get_default_or_raise
+
+    def default_factory(self, f):
+        """Overrides the method in `Field` so as to update the functions used to get the default value."""
+        super(DescriptorField, self).default_factory(f)
+        self._init_default_getters()
+        return f
+
+    def set_as_cls_member(self,
+                          owner_cls,
+                          name,
+                          owner_cls_type_hints=None,
+                          type_hint=None
+                          ):
+        """Overrides the method in `Field` so as to precompute the private attribute name once and for all."""
+        super(DescriptorField, self).set_as_cls_member(owner_cls, name, owner_cls_type_hints=owner_cls_type_hints,
+                                                       type_hint=type_hint)
+        # interned so that the instance dict lookups can use the identity fast path
+        self._private_name = intern("_" + self.name)
+
+        # name, type hint and nonable status may have changed: update the specialized setter
+        self._compile_setter()
+
     def add_validator(self,
                       validator  # type: ValidatorDef
                       ):
@@ -984,6 +1085,8 @@ class DescriptorField(Field):
         else:
             self.root_validator.add_validator(validator)
 
+        self._compile_setter()
+
     def add_converter(self,
                       converter_def  # type: ConverterFuncDefinition
                       ):
@@ -995,12 +1098,14 @@ class DescriptorField(Field):
             # concatenate the lists
             self.converters += converters
 
+        self._compile_setter()
+
     def __get__(self, obj, obj_type):
         # type: (...) -> T
 
         # do this first, because a field might be referenced from its class the first time it will be used
         # for example if in `make_init` we use a field defined in another class, that was not yet accessed on instance.
-        if self.name is None or self.type_hint is DELAYED:
+        if self._needs_fixup:
             # __set_name__ was not called yet. lazy-fix the name and type hints
             fix_field(obj_type, self)
 
@@ -1008,51 +1113,62 @@ class DescriptorField(Field):
             # class-level call: https://youtrack.jetbrains.com/issue/PY-38151 is solved, we can now return self
             return self
 
-        private_name = '_' + self.name
+        # Check if the field is already set in the object. Most of the time it is, so return it immediately
+        if self._use_dict:
+            try:
+                return obj.__dict__[self._private_name]
+            except KeyError:
+                pass
+        else:
+            value = getattr(obj, self._private_name, _unset)
+            if value is not _unset:
+                return value
 
-        # Check if the field is already set in the object
-        value = getattr(obj, private_name, _unset)
+        # nominal initialization on first read: we set the attribute in the object
+        return self._get_default(obj)
 
-        if value is _unset:
-            # mandatory field: raise an error
-            if self.is_mandatory:
-                raise MandatoryFieldInitError(self.name, obj)
+    def _get_default_safe(self, obj):
+        """`_get_default` implementation used when `self._default_is_safe is _YES`"""
+        value = self._get_default_or_raise(obj)
 
-            # optional: get default
-            if self.is_default_factory:
-                value = self.default(obj)
-            else:
-                value = self.default
+        # no need to validate/convert the default value, fast track (use the private name directly)
+        if self._use_dict:
+            obj.__dict__[self._private_name] = value
+        else:
+            setattr(obj, self._private_name, value)
+        return value
 
-            # nominal initialization on first read: we set the attribute in the object
-            if self._default_is_safe is _YES:
-                # no need to validate/convert the default value, fast track (use the private name directly)
-                setattr(obj, private_name, value)
-            else:
-                # we need conversion and validation - go through the setter (same as using the public name)
-                possibly_converted_value = self.__set__(obj, value, _return=True)
+    def _get_default_validated(self, obj):
+        """`_get_default` implementation used when `self._default_is_safe is _NO`"""
+        # we need conversion and validation - go through the setter (same as using the public name)
+        return self._do_set(obj, self._get_default_or_raise(obj))
 
-                if self._default_is_safe is _NO_BUT_CAN_CACHE_FIRST_RESULT:
-                    # there is a possibility to remember the new default and skip this next time
+    def _get_default_validated_once(self, obj):
+        """`_get_default` implementation used when `self._default_is_safe is _NO_BUT_CAN_CACHE_FIRST_RESULT`"""
+        value = self._get_default_or_raise(obj)
 
-                    # If there was a conversion, use the converted value as the new default
-                    if possibly_converted_value is not value:
-                        if self.is_default_factory:
-                            # Modify the `copy_value` factory
-                            self.default = self.default.clone_with_new_val(possibly_converted_value)
-                        else:
-                            # Modify the value
-                            self.default = possibly_converted_value
-                    # else:
-                    #     # no conversion: we can continue to use the same default value, it is valid
-                    #     pass
+        # we need conversion and validation - go through the setter (same as using the public name)
+        possibly_converted_value = self._do_set(obj, value)
 
-                    # mark the default as safe now, so that this is skipped next time
-                    self._default_is_safe = _YES
+        # there is a possibility to remember the new default and skip this next time
+        # If there was a conversion, use the converted value as the new default
+        if possibly_converted_value is not value:
+            if self.is_default_factory:
+                # Modify the `copy_value` factory
+                self.default = self.default.clone_with_new_val(possibly_converted_value)
+            else:
+                # Modify the value
+                self.default = possibly_converted_value
+        # else:
+        #     # no conversion: we can continue to use the same default value, it is valid
+        #     pass
 
-                return possibly_converted_value
+        # mark the default as safe now, and switch to the fast getter so that this is skipped next time
+        self._default_is_safe = _YES
+        self._get_default = self._get_default_safe
+        self._init_get_default_or_raise()
 
-        return value
+        return possibly_converted_value
 
     def trace_convert(self, value, obj=None):
         """Overrides the method in `Field` to provide a valid implementation."""
@@ -1060,13 +1176,12 @@ class DescriptorField(Field):
 
     def __set__(self,
                 obj,
-                value,         # type: T
-                _return=False  # type: bool
+                value  # type: T
                 ):
 
         # do this first, because a field might be referenced from its class the first time it will be used
         # for example if in `make_init` we use a field defined in another class, that was not yet accessed on instance.
-        if self.name is None or self.type_hint is DELAYED:
+        if self._needs_fixup:
             # __set_name__ was not called yet. lazy-fix the name and type hints
             fix_field(obj.__class__, self)
 
@@ -1075,82 +1190,366 @@ class DescriptorField(Field):
         #     # https://youtrack.jetbrains.com/issue/PY-38151 is solved, but what do we wish to do here actually ?
         #     raise ClassFieldAccessError(self)
 
-        if self.converters is not None:
-            # this is an inlined version of `trace_convert` with no capture of details
-            for converter in self.converters:
-                # noinspection PyBroadException
-                try:
-                    # does the converter accept this input ?
-                    accepted = converter.accepts(obj, self, value)
-                except Exception:  # noqa
-                    # ignore all exceptions from converters
-                    continue
-                else:
-                    if accepted is None or accepted:
-                        # if so, let's try to convert
-                        try:
-                            converted_value = converter.convert(obj, self, value)
-                        except Exception:  # noqa
-                            # ignore all exceptions from converters
-                            continue
-                        else:
-                            # successful conversion: use the converted value
-                            value = converted_value
-                            break
-                    else:
-                        continue
+        self._do_set(obj, value)
+
+    # the following attributes are used to compile the setter: changing them invalidates it
+
+    @property
+    def type_hint(self):
+        return _field_type_hint_slot.__get__(self, Field)
+
+    @type_hint.setter
+    def type_hint(self, type_hint):
+        _field_type_hint_slot.__set__(self, type_hint)
+        self._invalidate_setter()
+
+    @property
+    def default(self):
+        return _field_default_slot.__get__(self, Field)
+
+    @default.setter
+    def default(self, default):
+        _field_default_slot.__set__(self, default)
+        try:
+            self._get_default_or_raise
+        except AttributeError:
+            # called from the constructor: the default value getters are created at the end of it
+            return
+        self._init_get_default_or_raise()
+
+    @property
+    def nonable(self):
+        return _field_nonable_slot.__get__(self, Field)
+
+    @nonable.setter
+    def nonable(self, nonable):
+        _field_nonable_slot.__set__(self, nonable)
+        self._invalidate_setter()
+
+    @property
+    def check_type(self):
+        # type: (...) -> bool
+        return self._check_type
+
+    @check_type.setter
+    def check_type(self, check_type):
+        self._check_type = check_type
+        self._invalidate_setter()
 
-        # speedup for vars used several time
+    @property
+    def read_only(self):
+        # type: (...) -> bool
+        return self._read_only
+
+    @read_only.setter
+    def read_only(self, read_only):
+        self._read_only = read_only
+        self._invalidate_setter()
+
+    def _invalidate_setter(self):
+        """
+        Makes sure that the setter is compiled again, on next use. This is done lazily since several attributes may be
+        changed in a row, and since this may happen before all attributes used by `_compile_setter` are set.
+        """
+        self._do_set = self._compile_and_set
+
+    def _compile_and_set(self, obj, value):
+        """The setter used after `_invalidate_setter`: compiles the new setter and uses it."""
+        self._compile_setter()
+        return self._do_set(obj, value)
+
+    def _compile_setter(self):
+        """
+        Creates the setter function specialized for the current configuration of this field, and stores it in
+        `self._do_set`. That way, `__set__` does not need to check all the field options each time it is called.
+
+        This should be called again everytime the name, owner class, type hint, nonable status, converters or
+        validators change. The created function has signature `(obj, value)` and returns the value that was actually
+        set, so that callers can get the possibly converted value.
+        """
+        # values are stored in the instance `__dict__` directly, except for classes with `__slots__` and no `__dict__`,
+        # with a slot for the private name (see `@autoslots`), or customizing the attribute access
+        owner_cls = self.owner_cls
+        self._use_dict = owner_cls is not None and _instances_have_dict(owner_cls) \
+            and not _has_slot(owner_cls, self._private_name) and _has_default_attribute_access(owner_cls)
+
+        convert = self._make_converter() if self.converters is not None else None
+        check_type, check_isinstance = None, False
+        if self.check_type:
+            t = self.type_hint
+            if t is not EMPTY and (not USE_ADVANCED_TYPE_CHECKER or _isinstance_is_enough(t)):
+                # plain class(es): the `isinstance` check is inlined in the setter, no need for a checker function
+                check_type, check_isinstance = t, True
+            else:
+                check_type = self._make_type_checker()
+        validate = self.root_validator.assert_valid if self.root_validator is not None else None
+
+        make_setter = _get_setter_factory(has_converters=convert is not None, read_only=self.read_only,
+                                          nonable=self.nonable, check_type=check_type is not None,
+                                          validate=validate is not None, use_dict=self._use_dict,
+                                          check_isinstance=check_isinstance)
+        self._do_set = make_setter(self, self._private_name, convert, check_type, validate)
+
+    def _make_type_checker(self):
+        """
+        Returns a function with signature `(value)` checking the type of the value against the type hint.
+        """
         t = self.type_hint
-        nonable = self.nonable
-        private_name = "_" + self.name
-
-        # read-only check
-        if self.read_only:
-            # Check if the field is already set in the object
-            _v = getattr(obj, private_name, _unset)
-            if _v is not _unset:
-                raise ReadOnlyFieldError(self.qualname, obj)
-
-        # type checker and validators
-        if value is not None or nonable is UNKNOWN:
-            # check the type
-            if self.check_type:
-                if t is EMPTY:
-                    raise ValueError("`check_type` is enabled on field '%s' but no type hint is available. Please "
-                                     "provide type hints or set `field.check_type` to `False`. Note that python code is"
-                                     " not able to read type comments so if you wish to be compliant with python < 3.6 "
-                                     "you'll have to set the type hint explicitly in `field.type_hint` instead")
-
-                if USE_ADVANCED_TYPE_CHECKER:
-                    # take into account all the subtleties from `typing` module by relying on 3d party providers.
-                    assert_is_of_type(self, value, t)
-
-                elif not isinstance(value, t):
+        if t is EMPTY:
+            # This configuration error can not be raised at construction time since the type hint might be set later
+            # from the class annotations. Note that it is not raised when setting None on a nonable field.
+            msg = "`check_type` is enabled on field '%s' but no type hint is available. Please provide type hints " \
+                  "or set `field.check_type` to `False`. Note that python code is not able to read type comments so " \
+                  "if you wish to be compliant with python < 3.6 you'll have to set the type hint explicitly in " \
+                  "`field.type_hint` instead" % self.qualname
+
+            def check_type(value):
+                raise ValueError(msg)
+        elif USE_ADVANCED_TYPE_CHECKER and not _isinstance_is_enough(t):
+            def check_type(value):
+                # take into account all the subtleties from `typing` module by relying on 3d party providers.
+                assert_is_of_type(self, value, t)
+        else:
+            # no advanced type checker, or plain class(es) for which it would be equivalent to `isinstance`
+            def check_type(value):
+                if not isinstance(value, t):
                     raise FieldTypeError(self, value, t)
 
-            # run the validators
-            if self.root_validator is not None:
-                self.root_validator.assert_valid(obj, value)
+        return check_type
 
-        elif not nonable:
-            # value is None and field is not nonable: raise an error
-            # note: the root validator might not even exist, so do not reuse valid8 none rejecter here
-            raise NoneError(self)
-        # else:
-        #     # value is None and field is nonable: nothing to do
-        #     pass
-
-        # set the new value
-        setattr(obj, private_name, value)
+    def _make_converter(self):
+        """
+        Returns a function with signature `(obj, value)` converting the value using the first converter that accepts
+        it. If none is able to convert it, it is returned unchanged. This is an inlined version of `trace_convert` with
+        no capture of details.
+        """
+        # the `accepts` method is only needed when it is not the default one
+        fns = []
+        nbargs = []
+        for c in self.converters:
+            if accepts_all_values(c):
+                accepts_nbargs = None
+            else:
+                accepts, accepts_nbargs = get_base_callable(c.accepts)
+                fns.append(accepts)
+            convert, convert_nbargs = get_base_callable(c.convert)
+            fns.append(convert)
+            nbargs.append((accepts_nbargs, convert_nbargs))
 
-        # return it for the callers that need it
-        if _return:
-            return value
+        make_converter = _get_converter_factory(tuple(nbargs))
+        return make_converter(self, *fns)
 
     def __delete__(self, obj):
-        # private_name = "_" + self.name
-        delattr(obj, "_" + self.name)
+        if self._use_dict:
+            try:
+                del obj.__dict__[self._private_name]
+            except KeyError:
+                # same error than with `delattr`
+                raise AttributeError(self._private_name)
+        else:
+            delattr(obj, self._private_name)
+
+
+_NOT_PLAIN_TYPES = (float, complex, bytes)
+"""Classes for which PEP484 type checkers do not behave as `isinstance` (e.g. an `int` is a valid `float`)"""
+
+try:  # python 3.5+
+    from typing import Any as _Any
+except ImportError:
+    _Any = None
+
+
+def _isinstance_is_enough(type_hint):
+    """
+    Returns `True` if checking a value against `type_hint` with the advanced type checker would be equivalent to
+    using `isinstance`. This is the case for plain classes (and tuples of plain classes), except the ones in
+    `_NOT_PLAIN_TYPES`. `typing` constructs such as `Union` or `List[int]` are not classes. Note that on some python
+    versions `list[int]` is seen as a class, hence the `__args__` check, and so is `Any` (python 3.11+). Protocols
+    and TypedDicts are classes, but `isinstance` does not support them.
+    """
+    types = type_hint if isinstance(type_hint, tuple) else (type_hint, )
+    return all(isinstance(t, type) and t not in _NOT_PLAIN_TYPES and t is not _Any
+               and getattr(t, '__args__', None) is None
+               and not getattr(t, '_is_protocol', False)  # typing.Protocol subclasses
+               and not hasattr(t, '__total__')            # typing.TypedDict types
+               for t in types)
+
+
+def _instances_have_dict(cls):
+    """
+    Returns `True` if instances of `cls` have a `__dict__`. This is the case unless `cls` and all of its ancestors
+    define `__slots__` without `'__dict__'`.
+    """
+    return any('__dict__' in vars(_cls) for _cls in cls.__mro__)
+
+
+def _has_default_attribute_access(cls):
+    """
+    Returns `True` if `cls` does not override `__getattribute__`, `__setattr__` nor `__delattr__`, so that reading or
+    writing the instance `__dict__` directly is equivalent to using `getattr`, `setattr` and `delattr`.
+    """
+    return cls.__getattribute__ is object.__getattribute__ and cls.__setattr__ is object.__setattr__ \
+        and cls.__delattr__ is object.__delattr__
+
+
+def _has_slot(cls, name):
+    """
+    Returns `True` if `cls` or one of its ancestors defines a slot named `name` (in its `__slots__`).
+    """
+    return any(isinstance(vars(_cls).get(name), MemberDescriptorType) for _cls in cls.__mro__)
+
+
+_converter_factories = dict()
+"""A cache of the converter factories created by `_get_converter_factory`, by configuration"""
+
+
+def _get_converter_factory(nbargs  # type: Tuple[Tuple[Union[int, None], int], ...]
+                           ):
+    """
+    Returns a factory for `DescriptorField` converter functions, specialized for the given converters configuration.
+    `nbargs` contains one tuple `(accepts_nbargs, convert_nbargs)` per converter, indicating the number of arguments
+    of its base `accepts` and `convert` callables (see `get_base_callable`). `accepts_nbargs` is `None` if the converter
+    accepts all values (see `accepts_all_values`).
+
+    The factory has signature `(field, *fns)` where `fns` contains, for each converter in order, its base `accepts`
+    callable (only if it does not accept all values) and its base `convert` callable. It returns a converter function
+    with signature `(obj, value)` where calls to all converters are unrolled in straight-line code. Exceptions raised by
+    converters are ignored, as in `trace_convert`.
+
+    The source code of each factory is generated and compiled once and then cached.
+    """
+    try:
+        return _converter_factories[nbargs]
+    except KeyError:
+        pass
+
+    args = []
+    body = []
+    for i, (accepts_nbargs, convert_nbargs) in enumerate(nbargs):
+        convert_call = "convert%s(%s)" % (i, _CALL_ARGS[convert_nbargs])
+        if accepts_nbargs is None:
+            # no need to call `accepts`
+            args.append("convert%s" % i)
+            body += ["try:",
+                     "    return %s" % convert_call,
+                     "except Exception:",
+                     "    pass"]
+        else:
+            args += ["accepts%s" % i, "convert%s" % i]
+            body += ["try:",
+                     "    accepted = accepts%s(%s)" % (i, _CALL_ARGS[accepts_nbargs]),
+                     "except Exception:",
+                     "    pass",
+                     "else:",
+                     "    if accepted is None or accepted:",
+                     "        try:",
+                     "            return %s" % convert_call,
+                     "        except Exception:",
+                     "            pass"]
+    body.append("return value")
+
+    src = "def make_converter(field, %s):\n" \
+          "    def _convert(obj, value):\n" \
+          "%s\n" \
+          "    return _convert\n" % (", ".join(args), "\n".join("        " + line for line in body))
+
+    namespace = dict()
+    exec(compile(src, "<pyfields converter %r>" % (nbargs, ), "exec"), namespace)
+    make_converter = _converter_factories[nbargs] = namespace['make_converter']
+    return make_converter
+
+
+_CALL_ARGS = {1: "value", 2: "obj, value", 3: "obj, field, value"}
+"""The arguments to use in generated code to call a function with 1, 2 or 3 arguments (see `get_base_callable`)"""
+
+
+_setter_factories = dict()
+"""A cache of the setter factories created by `_get_setter_factory`, by configuration"""
+
+
+def _get_setter_factory(has_converters,  # type: bool
+                        read_only,       # type: bool
+                        nonable,         # type: Union[bool, Symbols]
+                        check_type,      # type: bool
+                        validate,        # type: bool
+                        use_dict,        # type: bool
+                        check_isinstance=False  # type: bool
+                        ):
+    """
+    Returns a factory for `DescriptorField` setter functions, specialized for the given configuration. The factory has
+    signature `(field, private_name, convert, check_type, validate)` and returns a setter function with signature
+    `(obj, value)`. The setter performs only the steps required for this configuration, in straight-line code.
+
+    If `check_isinstance` is True, the `check_type` argument of the factory is not a function but the class (or tuple
+    of classes) that values should be instances of, and the `isinstance` check is inlined in the setter.
+
+    The source code of each factory is generated and compiled once and then cached, so that the cost is paid only once
+    per configuration, not per field.
+    """
+    if nonable is not UNKNOWN:
+        nonable = bool(nonable)
+    key = has_converters, read_only, nonable, check_type, validate, use_dict, check_isinstance
+    try:
+        return _setter_factories[key]
+    except KeyError:
+        pass
+
+    body = []
+    # (1) conversion
+    if has_converters:
+        body.append("value = convert(obj, value)")
+
+    # (2) read-only check
+    if read_only:
+        if use_dict:
+            body.append("if private_name in obj.__dict__:")
+        else:
+            body.append("if getattr(obj, private_name, _unset) is not _unset:")
+        body.append("    raise ReadOnlyFieldError(field.qualname, obj)")
+
+    # (3) type check and validation, depending on the nonable status
+    checks = []
+    if check_type:
+        if check_isinstance:
+            checks += ["if not isinstance(value, check_type):",
+                       "    raise FieldTypeError(field, value, check_type)"]
+        else:
+            checks.append("check_type(value)")
+    if validate:
+        checks.append("validate(obj, value)")
+
+    if nonable is UNKNOWN:
+        # None values are checked as any other value
+        body += checks
+    elif nonable:
+        # None values are always accepted without checking
+        if len(checks) > 0:
+            body.append("if value is not None:")
+            body += ["    " + c for c in checks]
+    else:
+        # None values are rejected
+        # note: the root validator might not even exist, so do not reuse valid8 none rejecter here
+        body.append("if value is None:")
+        body.append("    raise NoneError(field)")
+        body += checks
+
+    # (4) storage
+    if use_dict:
+        body.append("obj.__dict__[private_name] = value")
+    else:
+        body.append("setattr(obj, private_name, value)")
+    body.append("return value")
+
+    src = "def make_setter(field, private_name, convert, check_type, validate):\n" \
+          "    def _do_set(obj, value):\n" \
+          "%s\n" \
+          "    return _do_set\n" % "\n".join("        " + line for line in body)
+
+    namespace = dict(_unset=_unset, ReadOnlyFieldError=ReadOnlyFieldError, NoneError=NoneError,
+                     FieldTypeError=FieldTypeError)
+    exec(compile(src, "<pyfields setter %r>" % (key, ), "exec"), namespace)
+    make_setter = _setter_factories[key] = namespace['make_setter']
+    return make_setter
 
 
 # noinspection PyShadowingNames
@@ -1173,20 +1572,66 @@ def fix_field(cls,                     # type: Type[Any]
     else:
         cls_type_hints = None
 
-    where_cls = getmro(cls) if include_inherited else (cls, )
-
-    found = False
-    for _cls in where_cls:
-        for member_name, member in vars(_cls).items():
+    if include_inherited:
+        # look for the field in the cached locations of all fields in the class and its ancestors
+        _cls, member_name = _find_field_location(cls, field)
+    else:
+        for member_name, member in vars(cls).items():
             # if not member_name.startswith('__'):   not stated in the doc: too dangerous to have such implicit filter
             if member is field:
-                # do the same than in __set_name__
-                field.set_as_cls_member(_cls, member_name, owner_cls_type_hints=cls_type_hints)
                 # found: no need to look further
-                found = True
+                _cls = cls
                 break
-        if found:
-            break
+        else:
+            raise ValueError("field %s was not found on class %s" % (field, cls))
+
+    # do the same than in __set_name__
+    field.set_as_cls_member(_cls, member_name, owner_cls_type_hints=cls_type_hints)
+
+
+_fields_locations = WeakKeyDictionary()
+"""A cache of the locations of all fields in each class (see `_find_field_location`)"""
+
+
+def _find_field_location(cls,   # type: Type[Any]
+                         field  # type: Field
+                         ):
+    """
+    Returns a tuple `(found_cls, member_name)` indicating where `field` is defined in `cls` or its ancestors, following
+    the mro.
+
+    The locations of all fields of `cls` are computed at once and cached, so that `fix_field` does not need to walk the
+    mro and all class members again for each field. The cache does not contain any strong reference to the class or
+    its fields: locations are stored as `(mro_index, member_name)` and are checked before being used.
+
+    :param cls:
+    :param field:
+    :return:
+    """
+    mro = getmro(cls)
+    try:
+        idx, member_name = _fields_locations[cls][id(field)]
+    except KeyError:
+        pass
+    else:
+        if vars(mro[idx]).get(member_name) is field:
+            return mro[idx], member_name
+
+    # cache miss, or the class was modified: (re)compute the locations of all fields.
+    locations = dict()
+    for idx in range(len(mro) - 1, -1, -1):
+        cls_locations = dict()
+        for member_name, member in vars(mro[idx]).items():
+            # if not member_name.startswith('__'):   not stated in the doc: too dangerous to have such implicit filter
+            if isinstance(member, Field):
+                cls_locations.setdefault(id(member), (idx, member_name))
+        # note: this overrides the locations found in ancestors
+        locations.update(cls_locations)
+    _fields_locations[cls] = locations
+
+    try:
+        idx, member_name = locations[id(field)]
+    except KeyError:
+        raise ValueError("field %s was not found on class %s%s" % (field, cls, 'or its ancestors'))
     else:
-        raise ValueError("field %s was not found on class %s%s"
-                         % (field, cls, 'or its ancestors' if include_inherited else ''))
+        return mro[idx], member_name
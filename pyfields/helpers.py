@@ -4,7 +4,11 @@
 # License: 3-clause BSD, <https://github.com/smarie/python-pyfields/blob/master/LICENSE>
 import sys
 from copy import copy, deepcopy
+from functools import partial
+from pickle import dumps, loads, HIGHEST_PROTOCOL
 from inspect import getmro, isclass
+from types import FunctionType
+from weakref import WeakKeyDictionary, ref
 
 try:
     from typing import Union, Type, TypeVar
@@ -12,7 +16,7 @@ try:
 except ImportError:
     pass
 
-from pyfields.core import Field, ClassFieldAccessError, PY36, get_type_hints
+from pyfields.core import Field, ClassFieldAccessError, PY36, get_type_hints, _CopyValue, fix_field
 
 
 class NotAFieldError(TypeError):
@@ -33,6 +37,28 @@ def get_field(cls, name):
     :param name:
     :return:
     """
+    # fast path: look for the member in the class dicts directly, so that plain members are rejected without getattr
+    try:
+        mro = cls.__mro__
+    except AttributeError:
+        # python 2 old-style classes
+        mro = getmro(cls)
+    for _cls in mro:
+        try:
+            member = vars(_cls)[name]
+        except KeyError:
+            continue
+        if isinstance(member, Field):
+            if member._needs_fixup:
+                # same as what happens when the field is accessed through the class
+                _fix_field_if_possible(cls, member)
+            return member
+        elif not hasattr(member, '__get__') or isinstance(member, FunctionType):
+            raise NotAFieldError(cls, name)
+        else:
+            # a custom descriptor might still give access to a field: use the slow path below
+            break
+
     try:
         member = getattr(cls, name)
     except ClassFieldAccessError as e:
@@ -49,6 +75,23 @@ def get_field(cls, name):
             raise NotAFieldError(cls, name)
 
 
+def _fix_field_if_possible(cls,   # type: Type
+                           field  # type: Field
+                           ):
+    """
+    Fixes the name and type hint of `field` on `cls` (see `fix_field`), for a field that needs it (`_needs_fixup`).
+    If its type hint is a forward reference that can not be resolved yet, it is left as is: it will be fixed later.
+
+    :param cls:
+    :param field:
+    :return:
+    """
+    try:
+        fix_field(cls, field)
+    except NameError:
+        pass
+
+
 def yield_fields(cls,
                  include_inherited=True,  # type: bool
                  remove_duplicates=True,  # type: bool
@@ -67,69 +110,117 @@ def yield_fields(cls,
     :param _auto_fix_fields:
     :return:
     """
-    # List the classes where we should be looking for fields
+    if _auto_fix_fields:
+        # this modifies the fields: do not use the cache
+        return iter(_collect_fields(cls, include_inherited=include_inherited, remove_duplicates=remove_duplicates,
+                                    ancestors_first=ancestors_first, public_only=public_only, _auto_fix_fields=True))
+    else:
+        return iter(_get_fields_cached(cls, include_inherited=include_inherited, remove_duplicates=remove_duplicates,
+                                       ancestors_first=ancestors_first, public_only=public_only))
+
+
+def _collect_fields(cls,
+                    include_inherited,  # type: bool
+                    remove_duplicates,  # type: bool
+                    ancestors_first,    # type: bool
+                    public_only,        # type: bool
+                    _auto_fix_fields    # type: bool
+                    ):
+    # type: (...) -> list
+    """
+    Implementation of `yield_fields` and `get_fields`. It builds a list rather than being a generator, so as to avoid
+    the cost of resuming a generator frame for each field.
+    """
+    # List the classes where we should be looking for fields, most derived first
     if include_inherited:
-        where_cls = reversed(getmro(cls)) if ancestors_first else getmro(cls)
+        try:
+            mro = cls.__mro__
+        except AttributeError:
+            # python 2 old-style classes
+            mro = getmro(cls)
+        else:
+            # `object` never contains fields but has many members: skip it
+            if mro[-1] is object:
+                mro = mro[:-1]
     else:
-        where_cls = (cls,)
-
-    # Init
-    _already_found_names = set() if remove_duplicates else None  # a reference set of already yielded field names
-    _cls_pep484_member_type_hints = None                         # where to hold found type hints if needed
-    _all_fields_for_cls = None                                   # temporary list when we have to reorder
-
-    # finally for each class, gather all fields in order
-    for _cls in where_cls:
-        if not PY36:
-            # in python < 3.6 we'll need to sort the fields at the end as class member order is not preserved
-            _all_fields_for_cls = []
-        elif _auto_fix_fields:
-            # in python >= 3.6, pep484 type hints can be available as member annotation, grab them
-            _cls_pep484_member_type_hints = get_type_hints(_cls)
-
-        for member_name in vars(_cls):
+        mro = (cls,)
+
+    _isinstance, _Field = isinstance, Field  # local aliases for the loops below
+
+    # (1) single pass on the class dicts, most derived first: collect the fields of each class, and remember the most
+    # derived member for each name (same as getattr) so that overridden fields can be resolved. Members of the last
+    # class do not need to be remembered since there is nothing to override after it.
+    _cls_members = dict()
+    _fields_per_cls = []
+    _last_cls = mro[-1] if mro else None
+    for _cls in mro:
+        _cls_fields = []
+        for member_name, member in vars(_cls).items():
             # if not member_name.startswith('__'):   not stated in the doc: too dangerous to have such implicit filter
+            if _cls is not _last_cls:
+                _cls_members.setdefault(member_name, member)
 
             # avoid infinite recursion as this method is called in the descriptor for __init__
             if not member_name == '__init__':
-                try:
-                    field = get_field(_cls, member_name)
-                except NotAFieldError:
-                    continue
-
-                if _auto_fix_fields:
-                    # take this opportunity to set the name and type hints
-                    field.set_as_cls_member(_cls, member_name, owner_cls_type_hints=_cls_pep484_member_type_hints)
-
-                if public_only and member_name.startswith('_'):
-                    continue
-
-                if remove_duplicates:
-                    if member_name in _already_found_names:
-                        continue
-                    else:
-                        _already_found_names.add(member_name)
-
-                # maybe the field is overridden, in that case we should directly yield the new one
-                if _cls is not cls:
+                if _isinstance(member, _Field):
+                    # fast path: fields are stored as is in the class dict
+                    _cls_fields.append((member_name, member))
+                elif hasattr(member, '__get__') and not _isinstance(member, FunctionType):
+                    # slow path: a custom descriptor might still give access to a field
                     try:
-                        overridden_field = get_field(cls, member_name)
+                        _cls_fields.append((member_name, get_field(_cls, member_name)))
                     except NotAFieldError:
-                        overridden_field = None
+                        pass
+
+        if _cls_fields:
+            if not PY36:
+                # order is random in python < 3.6 - we need to explicitly sort according to instance creation number
+                _cls_fields.sort(key=lambda f: f[1].__fieldinstcount__)
+            _fields_per_cls.append((_cls, _cls_fields))
+
+    # (2) gather all fields in the appropriate order
+    res = []
+    # note: names are unique within a single class dict, so duplicates can only appear with inherited fields
+    _already_found_names = set() if (remove_duplicates and include_inherited) else None
+    for _cls, _cls_fields in (reversed(_fields_per_cls) if ancestors_first else _fields_per_cls):
+        # in python >= 3.6, pep484 type hints can be available as member annotation. They will be grabbed lazily
+        # when the first field of this class needs to be fixed, since this is costly.
+        _cls_pep484_member_type_hints = None
+
+        for member_name, field in _cls_fields:
+            if _auto_fix_fields:
+                if PY36 and _cls_pep484_member_type_hints is None:
+                    _cls_pep484_member_type_hints = get_type_hints(_cls)
+                # take this opportunity to set the name and type hints
+                field.set_as_cls_member(_cls, member_name, owner_cls_type_hints=_cls_pep484_member_type_hints)
+            elif field._needs_fixup:
+                # no name or delayed type hint: fix it now, as accessing it through the class would do
+                _fix_field_if_possible(_cls, field)
+
+            if public_only and member_name.startswith('_'):
+                continue
+
+            if _already_found_names is not None:
+                if member_name in _already_found_names:
+                    continue
                 else:
-                    overridden_field = None
-
-                # finally yield it...
-                if PY36:  # ...immediately in recent python versions because order is correct already
-                    yield field if overridden_field is None else overridden_field
-                else:     # ...or wait for this class to be collected, because the order needs to be fixed
-                    _all_fields_for_cls.append((field, overridden_field))
+                    _already_found_names.add(member_name)
+
+            # maybe the field is overridden, in that case we should directly use the new one
+            overridden_field = _cls_members.get(member_name, field)
+            if overridden_field is field or _isinstance(overridden_field, _Field):
+                res.append(overridden_field)
+            elif hasattr(overridden_field, '__get__') and not _isinstance(overridden_field, FunctionType):
+                # slow path: a custom descriptor might still give access to a field
+                try:
+                    res.append(get_field(cls, member_name))
+                except NotAFieldError:
+                    res.append(field)
+            else:
+                # overridden with something that is not a field
+                res.append(field)
 
-        if not PY36:
-            # order is random in python < 3.6 - we need to explicitly sort according to instance creation number
-            _all_fields_for_cls.sort(key=lambda f: f[0].__fieldinstcount__)
-            for field, overridden_field in _all_fields_for_cls:
-                yield field if overridden_field is None else overridden_field
+    return res
 
 
 def has_fields(cls,
@@ -144,7 +235,40 @@ def has_fields(cls,
     :param include_inherited:
     :return:
     """
-    return any(yield_fields(cls, include_inherited=include_inherited))
+    # note: this is equivalent to `any(yield_fields(cls, include_inherited))` but stops at the first field found,
+    # without creating a generator. Class members are only accessed through `getattr` when needed (see below).
+    if include_inherited:
+        try:
+            where_cls = cls.__mro__
+        except AttributeError:
+            # python 2 old-style classes
+            where_cls = getmro(cls)
+    else:
+        where_cls = (cls,)
+
+    # local aliases for the loop below
+    _isinstance, _Field = isinstance, Field
+
+    for _cls in where_cls:
+        if _cls is object:
+            # `object` never contains fields
+            continue
+        for member_name, member in vars(_cls).items():
+            # avoid infinite recursion as this method may be called in the descriptor for __init__
+            if member_name == '__init__':
+                continue
+            if _isinstance(member, _Field):
+                # fast path: fields are stored as is in the class dict
+                return True
+            elif hasattr(member, '__get__') and not _isinstance(member, FunctionType):
+                # slow path: a custom descriptor might still give access to a field, as in `_collect_fields`
+                try:
+                    get_field(_cls, member_name)
+                    return True
+                except NotAFieldError:
+                    pass
+
+    return False
 
 
 if sys.version_info >= (3, 7):
@@ -227,30 +351,99 @@ def get_fields(cls_or_obj,
     if not safe_isclass(cls_or_obj):
         cls_or_obj = cls_or_obj.__class__
 
-    return container_type(yield_fields(cls_or_obj, include_inherited=include_inherited, public_only=public_only,
-                                       remove_duplicates=remove_duplicates, ancestors_first=ancestors_first,
-                                       _auto_fix_fields=_auto_fix_fields))
+    if _auto_fix_fields:
+        # this modifies the fields: do not use the cache
+        fields = _collect_fields(cls_or_obj, include_inherited=include_inherited, public_only=public_only,
+                                 remove_duplicates=remove_duplicates, ancestors_first=ancestors_first,
+                                 _auto_fix_fields=True)
+        return fields if container_type is list else container_type(fields)
 
+    fields = _get_fields_cached(cls_or_obj, include_inherited=include_inherited, public_only=public_only,
+                                remove_duplicates=remove_duplicates, ancestors_first=ancestors_first)
+    return fields if container_type is tuple else container_type(fields)
 
-# def ordered_dir(cls,
-#                 ancestors_first=False  # type: bool
-#                 ):
-#     """
-#     since `dir` does not preserve order, lets have our own implementation
-#
-#     :param cls:
-#     :param ancestors_first:
-#     :return:
-#     """
-#     classes = reversed(getmro(cls)) if ancestors_first else getmro(cls)
-#
-#     for _cls in classes:
-#         for k in vars(_cls):
-#             yield k
+
+_fields_cache = WeakKeyDictionary()
+"""A cache of the fields of each class, for each combination of `get_fields` options (see `_get_fields_cached`)"""
+
+
+def _get_fields_cached(cls,
+                       include_inherited,  # type: bool
+                       remove_duplicates,  # type: bool
+                       ancestors_first,    # type: bool
+                       public_only,        # type: bool
+                       ):
+    # type: (...) -> tuple
+    """
+    Returns `tuple(yield_fields(cls, ...))`, using a cache.
+
+    The cache is invalidated when the members of the class or of its ancestors change, see `_get_classes_state`. It
+    only holds weak references to the fields: otherwise the cached fields would keep their owner class alive through
+    `field.owner_cls`.
+    """
+    options = include_inherited, remove_duplicates, ancestors_first, public_only
+    try:
+        cls_cache = _fields_cache[cls]
+    except KeyError:
+        cls_cache = None
+    except TypeError:
+        # the class can not be weakly referenced: no cache
+        return tuple(_collect_fields(cls, include_inherited=include_inherited, public_only=public_only,
+                                     remove_duplicates=remove_duplicates, ancestors_first=ancestors_first,
+                                     _auto_fix_fields=False))
+
+    state = _get_classes_state(cls, include_inherited)
+    if cls_cache is not None:
+        try:
+            cached_state, field_refs = cls_cache[options]
+        except KeyError:
+            pass
+        else:
+            if cached_state == state:
+                fields = tuple(r() for r in field_refs)
+                # note: fields that still need to be fixed are collected again, so that they are fixed if possible
+                if None not in fields and not any(f._needs_fixup for f in fields):
+                    return fields
+
+    # compute and cache
+    fields = tuple(_collect_fields(cls, include_inherited=include_inherited, public_only=public_only,
+                                   remove_duplicates=remove_duplicates, ancestors_first=ancestors_first,
+                                   _auto_fix_fields=False))
+    _fields_cache.setdefault(cls, dict())[options] = state, tuple(ref(f) for f in fields)
+    return fields
+
+
+def _get_classes_state(cls,
+                       include_inherited  # type: bool
+                       ):
+    # type: (...) -> tuple
+    """
+    Returns an identifier of the current members of `cls` (and of its ancestors if `include_inherited` is True), used
+    to invalidate the `get_fields` cache. It changes when a member is added, removed or replaced, or when the mro
+    changes. It only contains names and ids (of the members and of their types) so that the cache does not keep any
+    object alive.
+
+    A member replaced with a new object that happens to have the same id and type is not detected. For fields, this is
+    not an issue since the cache checks that the weakly referenced fields are still alive. It can be an issue for
+    custom descriptors giving access to a field (see `get_field`): in that case the cache may return the old field.
+    """
+    if include_inherited:
+        try:
+            mro = cls.__mro__
+        except AttributeError:
+            # python 2 old-style classes
+            mro = getmro(cls)
+    else:
+        mro = (cls,)
+
+    # note: `object` never contains fields
+    return tuple((id(_cls), tuple(vars(_cls)), tuple(map(id, vars(_cls).values())),
+                  tuple(id(type(v)) for v in vars(_cls).values()))
+                 for _cls in mro if _cls is not object)
 
 
 def copy_value(val,
-               deep=True,      # type: bool
+               deep=True,      # type: Union[bool, str]
                autocheck=True  # type: bool
                ):
     """
@@ -259,13 +452,27 @@ def copy_value(val,
     That factory will create a copy of the provided `val` everytime it is called. Handy if you wish to use mutable
     objects as default values for your fields ; for example lists.
 
+    Note: when `val` only contains builtin containers and values (for example a list of dicts of strings), deep
+    copies are created from a pickled snapshot of `val` taken here, which is much faster than `deepcopy`. Later
+    modifications of `val` are therefore not seen by the factory. Use `deep='deepcopy'` to always deep-copy the
+    current `val` instead.
+
     :param val: the (mutable) value to copy
-    :param deep: by default deep copies will be created. You can change this behaviour by setting this to `False`
+    :param deep: by default deep copies will be created. You can change this behaviour by setting this to `False`.
+        Setting this to `'deepcopy'` creates deep copies with `deepcopy`, even for builtin containers and values.
     :param autocheck: if this is True (default), an initial copy will be created when the method is called, so as to
         alert the user early if this leads to errors.
     :return:
     """
+    if _is_immutable(val):
+        # no need to copy: the factory will always return the same object
+        return _NoCopyValue(val, deep)
+
     if deep:
+        if deep != 'deepcopy' and _is_plain_data(val):
+            # builtin containers and values: pickle is equivalent to deepcopy, and much faster
+            return _PickledCopyValue(val)
+
         if autocheck:
             try:
                 # autocheck: make sure that we will be able to create copies later
@@ -273,8 +480,7 @@ def copy_value(val,
             except Exception as e:
                 raise ValueError("The provided default value %r can not be deep-copied: caught error %r" % (val, e))
 
-        def create_default(obj):
-            return deepcopy(val)
+        return _DeepCopyValue(val, deep)
     else:
         if autocheck:
             try:
@@ -283,19 +489,144 @@ def copy_value(val,
             except Exception as e:
                 raise ValueError("The provided default value %r can not be copied: caught error %r" % (val, e))
 
-        def create_default(obj):
-            return copy(val)
+        return _ShallowCopyValue(val)
 
-    # attach a method to easily get a new factory with a new value
-    def get_copied_value():
-        return val
 
-    def clone_with_new_val(newval):
-        return copy_value(newval, deep)
+try:  # python 2
+    # noinspection PyUnresolvedReferences,PyCompatibility
+    _IMMUTABLE_TYPES = {type(None), bool, int, long, float, complex, str, unicode, bytes}  # noqa
+except NameError:  # python 3
+    _IMMUTABLE_TYPES = {type(None), bool, int, float, complex, str, bytes}
 
-    create_default.get_copied_value = get_copied_value
-    create_default.clone_with_new_val = clone_with_new_val
-    return create_default
+# types for which `copy` returns the value as is
+_SHALLOW_IMMUTABLE_TYPES = _IMMUTABLE_TYPES | {tuple, frozenset}
+
+
+def _is_immutable(val):
+    """
+    Returns True if `val` is known to be immutable, so that copying it is useless. Exact types are checked, since
+    subclasses of immutable types may be mutable.
+
+    :param val:
+    :return:
+    """
+    val_type = val.__class__
+    if val_type in _IMMUTABLE_TYPES:
+        return True
+    elif val_type is tuple or val_type is frozenset:
+        # the container is immutable but its contents might not be
+        return all(_is_immutable(v) for v in val)
+    else:
+        return False
+
+
+_PLAIN_CONTAINER_TYPES = {list, tuple, dict, set, frozenset}
+
+
+def _is_plain_data(val, _seen_ids=None):
+    """
+    Returns True if `val` only contains builtin containers and immutable values, so that a pickle round-trip creates
+    exactly the same copy as `deepcopy`. Exact types are checked, since subclasses may customize copy or pickling.
+
+    :param val:
+    :param _seen_ids: the ids of the containers already checked, to support self-references
+    :return:
+    """
+    val_type = val.__class__
+    if val_type in _IMMUTABLE_TYPES:
+        return True
+    elif val_type in _PLAIN_CONTAINER_TYPES:
+        if _seen_ids is None:
+            _seen_ids = set()
+        elif id(val) in _seen_ids:
+            return True
+        _seen_ids.add(id(val))
+        if val_type is dict:
+            return all(_is_plain_data(k, _seen_ids) and _is_plain_data(v, _seen_ids) for k, v in val.items())
+        else:
+            return all(_is_plain_data(v, _seen_ids) for v in val)
+    else:
+        return False
+
+
+class _PickledCopyValue(_CopyValue):
+    """
+    The default value factory returned by `copy_value(val, deep=True)` when `val` is plain data (see `_is_plain_data`).
+    Copies are created by unpickling a snapshot of `val`.
+    """
+    __slots__ = ('_dump', )
+
+    def __init__(self, val):
+        super(_PickledCopyValue, self).__init__(val)
+        self._dump = dumps(val, HIGHEST_PROTOCOL)
+
+    def __call__(self, obj, _loads=loads):
+        return _loads(self._dump)
+
+    def get_copied_value(self):
+        # the snapshot, not `val` that may have been modified since
+        return loads(self._dump)
+
+    def clone_with_new_val(self, newval):
+        return copy_value(newval, deep=True)
+
+
+class _NoCopyValue(_CopyValue):
+    """
+    The default value factory returned by `copy_value(val)` when `val` is immutable.
+    """
+    __slots__ = ('deep', )
+
+    def __init__(self, val, deep):
+        super(_NoCopyValue, self).__init__(val)
+        self.deep = deep
+
+    def __call__(self, obj):
+        return self.val
+
+    def clone_with_new_val(self, newval):
+        return copy_value(newval, deep=self.deep)
+
+
+class _DeepCopyValue(_CopyValue):
+    """
+    The default value factory returned by `copy_value(val, deep=True)`.
+    """
+    __slots__ = ('deep', )
+
+    def __init__(self, val, deep):
+        super(_DeepCopyValue, self).__init__(val)
+        self.deep = deep
+
+    def __call__(self, obj, _deepcopy=deepcopy):
+        return _deepcopy(self.val)
+
+    def clone_with_new_val(self, newval):
+        return copy_value(newval, deep=self.deep)
+
+
+class _ShallowCopyValue(_CopyValue):
+    """
+    The default value factory returned by `copy_value(val, deep=False)`.
+
+    The function used to copy the value is selected once here: builtin containers are copied with their own `copy`
+    method, which is what `copy.copy` ends up calling anyway.
+    """
+    __slots__ = ('_do_copy', )
+
+    def __init__(self, val):
+        super(_ShallowCopyValue, self).__init__(val)
+        if val.__class__ in (list, dict, set):
+            # note: on old python versions, list.copy does not exist
+            self._do_copy = getattr(val, 'copy', None) or partial(copy, val)
+        else:
+            self._do_copy = partial(copy, val)
+
+    def __call__(self, obj):
+        return self._do_copy()
+
+    def clone_with_new_val(self, newval):
+        return copy_value(newval, deep=False)
 
 
 def copy_field(field_or_name,  # type: Union[str, Field]
@@ -315,13 +646,9 @@ def copy_field(field_or_name,  # type: Union[str, Field]
         if field_or_name.name is None:
             # Name not yet available, we'll get it later
             if deep:
-                def create_default(obj):
-                    return deepcopy(getattr(obj, field_or_name.name))
+                return _DeepCopyField(field_or_name)
             else:
-                def create_default(obj):
-                    return copy(getattr(obj, field_or_name.name))
-
-            return create_default
+                return _ShallowCopyField(field_or_name)
         else:
             # use the field name
             return copy_attr(field_or_name.name, deep=deep)
@@ -330,23 +657,76 @@ def copy_field(field_or_name,  # type: Union[str, Field]
         return copy_attr(field_or_name, deep=deep)
 
 
+class _DeepCopyField(object):
+    """
+    The default value factory returned by `copy_field(field, deep=True)` when the field has no name yet.
+    """
+    __slots__ = ('field', )
+
+    def __init__(self, field):
+        self.field = field
+
+    def __call__(self, obj, _deepcopy=deepcopy, _getattr=getattr):
+        val = _getattr(obj, self.field.name)
+        return val if val.__class__ in _IMMUTABLE_TYPES else _deepcopy(val)
+
+
+class _ShallowCopyField(object):
+    """
+    The default value factory returned by `copy_field(field, deep=False)` when the field has no name yet.
+    """
+    __slots__ = ('field', )
+
+    def __init__(self, field):
+        self.field = field
+
+    def __call__(self, obj, _copy=copy, _getattr=getattr):
+        val = _getattr(obj, self.field.name)
+        return val if val.__class__ in _SHALLOW_IMMUTABLE_TYPES else _copy(val)
+
+
 def copy_attr(attr_name,  # type: str
               deep=True   # type: bool
               ):
     """
     Returns a default value factory to be used in a `field(default_factory=...)`.
 
-    That factory will create a copy of the value in the given attribute.
+    That factory will create a copy of the value in the given attribute. Values of builtin immutable types (such as
+    `int` or `str`) are returned as is since there is no need to copy them.
 
     :param attr_name: the name of the attribute for which the value will be copied
     :param deep: by default deep copies will be created. You can change this behaviour by setting this to `False`
     :return:
     """
     if deep:
-        def create_default(obj):
-            return deepcopy(getattr(obj, attr_name))
+        return _DeepCopyAttr(attr_name)
     else:
-        def create_default(obj):
-            return copy(getattr(obj, attr_name))
+        return _ShallowCopyAttr(attr_name)
+
+
+class _DeepCopyAttr(object):
+    """
+    The default value factory returned by `copy_attr(attr_name, deep=True)`.
+    """
+    __slots__ = ('attr_name', )
+
+    def __init__(self, attr_name):
+        self.attr_name = attr_name
+
+    def __call__(self, obj, _deepcopy=deepcopy, _getattr=getattr):
+        val = _getattr(obj, self.attr_name)
+        return val if val.__class__ in _IMMUTABLE_TYPES else _deepcopy(val)
+
+
+class _ShallowCopyAttr(object):
+    """
+    The default value factory returned by `copy_attr(attr_name, deep=False)`.
+    """
+    __slots__ = ('attr_name', )
+
+    def __init__(self, attr_name):
+        self.attr_name = attr_name
 
-    return create_default
+    def __call__(self, obj, _copy=copy, _getattr=getattr):
+        val = _getattr(obj, self.attr_name)
+        return val if val.__class__ in _SHALLOW_IMMUTABLE_TYPES else _copy(val)
@@ -4,12 +4,19 @@
 # License: 3-clause BSD, <https://github.com/smarie/python-pyfields/blob/master/LICENSE>
 import sys
 from inspect import isfunction, getmro
-from itertools import islice
+from types import FunctionType
+from functools import update_wrapper
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+try:  # python 3.4+
+    from dis import get_instructions
+except ImportError:
+    get_instructions = None
 
 try:
-    from inspect import signature, Parameter, Signature
+    from inspect import signature, Signature, Parameter
 except ImportError:
-    from funcsigs import signature, Parameter, Signature
+    from funcsigs import signature, Signature, Parameter
 
 
 try:  # python 3.5+
@@ -19,8 +26,6 @@ except ImportError:
     use_type_hints = False
 
 
-from makefun import wraps, with_signature
-
 from pyfields.core import PY36, USE_FACTORY, EMPTY, Field
 from pyfields.helpers import get_fields
 
@@ -76,13 +81,15 @@ def init_fields(*fields,   # type: Union[Field, Any]
         subclass). If set to `False` the contrary will happen.
     :return:
     """
-    init_args_before, ancestor_fields_first = pop_kwargs(kwargs, [('init_args_before', True),
-                                                                  ('ancestor_fields_first', None)], allow_others=False)
+    init_args_before = kwargs.pop('init_args_before', True)
+    ancestor_fields_first = kwargs.pop('ancestor_fields_first', None)
+    if len(kwargs) > 0:
+        raise ValueError("Unsupported arguments: %s" % kwargs)
 
     if len(fields) == 1:
         # used without argument ?
         f = fields[0]
-        if isfunction(f) and not isinstance(f, Field) and init_args_before:
+        if not isinstance(f, Field) and isfunction(f) and init_args_before:
             # @init_fields decorator used without parenthesis
 
             # The list of fields is NOT explicit: we have no way to gather this list without creating a descriptor
@@ -141,7 +148,7 @@ def inject_fields(*fields  # type: Union[Field, Any]
     if len(fields) == 1:
         # used without argument ?
         f = fields[0]
-        if isfunction(f) and not isinstance(f, Field):
+        if not isinstance(f, Field) and isfunction(f):
             # @inject_fields decorator used without parenthesis
 
             # The list of fields is NOT explicit: we have no way to gather this list without creating a descriptor
@@ -239,9 +246,11 @@ def make_init(*fields,  # type: Union[Field, Any]
     :return: a constructor method to be used as `__init__`
     """
     # python <3.5 compliance: pop the kwargs following the varargs
-    post_init_fun, post_init_args_before, ancestor_fields_first = pop_kwargs(kwargs, [
-        ('post_init_fun', None), ('post_init_args_before', True), ('ancestor_fields_first', None)
-    ], allow_others=False)
+    post_init_fun = kwargs.pop('post_init_fun', None)
+    post_init_args_before = kwargs.pop('post_init_args_before', True)
+    ancestor_fields_first = kwargs.pop('ancestor_fields_first', None)
+    if len(kwargs) > 0:
+        raise ValueError("Unsupported arguments: %s" % kwargs)
 
     return InitDescriptor(fields=fields, user_init_fun=post_init_fun, user_init_args_before=post_init_args_before,
                           user_init_is_injected=False, ancestor_fields_first=ancestor_fields_first)
@@ -301,7 +310,13 @@ class InitDescriptor(object):
             # classes init have their owner class properly set, .
             # That way, when the subclass __init__ will be called, containing potential calls to super(), the parents'
             # __init__ method descriptors will be correctly configured.
-            for _c in reversed(getmro(objtype)[1:-1]):
+            try:
+                mro = objtype.__mro__
+            except AttributeError:
+                # python 2 old-style classes
+                mro = getmro(objtype)
+            # note: nothing to do for classes with no parent class except object
+            for _c in reversed(mro[1:-1]):
                 try:
                     _init_member = _c.__dict__['__init__']
                 except KeyError:
@@ -319,14 +334,21 @@ class InitDescriptor(object):
             fields = get_fields(objtype, include_inherited=True, ancestors_first=self.ancestor_fields_first,
                                 _auto_fix_fields=not PY36)
         elif not PY36:
-            # take this opportunity to apply all field names including inherited
+            # take this opportunity to apply all field names including inherited. Without `_auto_fix_fields`, only
+            # the fields that still need it are fixed (see `Field._needs_fixup`): the others are already set up.
             # TODO set back inherited = False when the bug with class-level access is solved -> make_init will be ok
-            get_fields(objtype, include_inherited=True, ancestors_first=self.ancestor_fields_first,
-                       _auto_fix_fields=True)
+            get_fields(objtype, include_inherited=True, ancestors_first=self.ancestor_fields_first)
 
         # create the init method
         new_init = create_init(fields=fields, inject_fields=self.user_init_is_injected,
                                user_init_fun=self.user_init_fun, user_init_args_before=self.user_init_args_before)
+        if self.user_init_fun is None:
+            # no user function to copy the metadata from: the new init belongs to this class
+            new_init.__module__ = objtype.__module__
+            try:
+                new_init.__qualname__ = "%s.__init__" % objtype.__qualname__
+            except AttributeError:
+                pass  # python 2
 
         # replace it forever in the class
         # setattr(objtype, '__init__', new_init)
@@ -355,13 +377,76 @@ class InjectedInitFieldsArg(object):
         :param obj:
         :return:
         """
+        # note: the subclasses generated by `_get_injected_fields_arg_type` override this with straight-line code
+        use_factory, _setattr, _getattr = USE_FACTORY, setattr, getattr
         for field_name, field_value in self.field_values.items():
-            if field_value is not USE_FACTORY:
+            if field_value is not use_factory:
                 # init the field with the provided value or the injected default value
-                setattr(obj, field_name, field_value)
+                _setattr(obj, field_name, field_value)
             else:
                 # init the field with its factory
-                getattr(obj, field_name)
+                _getattr(obj, field_name)
+
+
+_injected_fields_arg_types = dict()
+"""A cache of the `InjectedInitFieldsArg` subclasses created by `_get_injected_fields_arg_type`"""
+
+
+def _get_injected_fields_arg_type(field_names,         # type: Tuple[str, ...]
+                                  factory_field_names  # type: frozenset
+                                  ):
+    """
+    Returns a subclass of `InjectedInitFieldsArg` specialized for the given field names: its constructor receives the
+    field values as positional arguments (in the order of `field_names`) and its `init` method initializes all fields
+    in straight-line code, without iterating on `field_values`. Only the fields in `factory_field_names` (fields with a
+    default value factory) are checked against `USE_FACTORY`. Subclasses are cached so that each set of field names
+    is only compiled once.
+
+    :param field_names:
+    :param factory_field_names:
+    :return:
+    """
+    try:
+        return _injected_fields_arg_types[(field_names, factory_field_names)]
+    except KeyError:
+        pass
+
+    body = ["field_values = self.field_values"]
+    for field_name in field_names:
+        if field_name in factory_field_names:
+            body += ["value = field_values[%r]" % field_name,
+                     "if value is not _pyfields_USE_FACTORY:",
+                     "    # init the field with the provided value or the injected default value",
+                     "    obj.%s = value" % field_name,
+                     "else:",
+                     "    # init the field with its factory",
+                     "    obj.%s" % field_name]
+        else:
+            # init the field with the provided value or its default value
+            body.append("obj.%s = field_values[%r]" % (field_name, field_name))
+    src = "def init(self, obj):\n" + "\n".join("    " + line for line in body) + "\n"
+
+    filename = "<pyfields injected init %s>" % ", ".join(field_names)
+    init = _compile_with_closure(src, 'init', filename, _pyfields_USE_FACTORY=USE_FACTORY)
+    init.__doc__ = InjectedInitFieldsArg.init.__doc__
+
+    # the constructor directly builds the `field_values` dict from its arguments
+    src = "def __init__(%s):\n" % ", ".join(("self",) + field_names)
+    src += "    self.field_values = {%s}\n" % ", ".join("%r: %s" % (f_name, f_name) for f_name in field_names)
+    __init__ = _compile_with_closure(src, '__init__', filename)
+
+    new_type = type(InjectedInitFieldsArg)("InjectedInitFieldsArg", (InjectedInitFieldsArg,),
+                                           dict(__slots__=(), __module__=__name__, __init__=__init__, init=init,
+                                                __doc__=InjectedInitFieldsArg.__doc__))
+    _injected_fields_arg_types[(field_names, factory_field_names)] = new_type
+    return new_type
+
+
+_SELF_PARAM = Parameter('self', kind=Parameter.POSITIONAL_OR_KEYWORD)
+"""The first parameter of all generated `__init__` methods (parameters are immutable so it can be shared)"""
+
+_RESERVED_PREFIX = '_pyfields_'
+"""The prefix of the names that the generated code reads from its closure, so that no argument can shadow them"""
 
 
 def create_init(fields,                     # type: Iterable[Field]
@@ -374,44 +459,81 @@ def create_init(fields,                     # type: Iterable[Field]
     It requires that all fields have correct names and type hints so we usually execute it from within a __init__
     descriptor.
 
+    Classes with the same "shape" (same user init function and options, and same field names, kinds, default values
+    and type hints) share the same generated code, see `_inits_cache`. Each of them receives its own function object
+    though, so that its metadata (`__module__`, `__qualname__`...) can be set per class.
+
     :param fields:
     :param user_init_fun:
     :param inject_fields:
     :param user_init_args_before:
     :return:
     """
+    fields = tuple(fields)
+
+    # the generated function only depends on the following, so it can be shared. Objects are identified by id: this is
+    # safe because the generated function keeps a reference to all of them (defaults, annotations, closure)
+    shape = (id(user_init_fun), inject_fields, user_init_args_before) \
+        + tuple((f.name, f.is_mandatory, f.is_default_factory, None if f.is_default_factory else id(f.default),
+                 id(f.type_hint)) for f in fields)
+    try:
+        return _copy_function(_inits_cache[shape])
+    except KeyError:
+        pass
+
+    __init__ = _create_init(fields, user_init_fun=user_init_fun, inject_fields=inject_fields,
+                            user_init_args_before=user_init_args_before)
+    _inits_cache[shape] = __init__
+    return __init__
+
+
+_inits_cache = WeakValueDictionary()
+"""A cache of the `__init__` functions generated by `create_init`, by class shape. Each entry disappears with the
+function it contains."""
+
+
+def _copy_function(f):
+    """
+    Returns a new function with the same code, globals, closure, defaults and metadata than `f`.
+
+    :param f:
+    :return:
+    """
+    new_f = FunctionType(f.__code__, f.__globals__, f.__name__, f.__defaults__, f.__closure__)
+    new_f.__dict__.update(f.__dict__)
+    new_f.__doc__ = f.__doc__
+    new_f.__module__ = f.__module__
+    try:
+        new_f.__kwdefaults__ = f.__kwdefaults__
+        new_f.__annotations__ = dict(f.__annotations__)
+        new_f.__qualname__ = f.__qualname__
+    except AttributeError:
+        pass  # python 2
+    return new_f
+
+
+def _create_init(fields,                     # type: Tuple[Field, ...]
+                 user_init_fun=None,         # type: Callable[[...], Any]
+                 inject_fields=False,        # type: bool
+                 user_init_args_before=True  # type: bool
+                 ):
+    """
+    Implementation of `create_init`, without cache.
+    """
     # the list of parameters that should be exposed
-    params = [Parameter('self', kind=Parameter.POSITIONAL_OR_KEYWORD)]
+    params = [_SELF_PARAM]
 
     if user_init_fun is None:
         # A - no function provided: expose a signature containing 'self' + fields
         field_names, _ = _insert_fields_at_position(fields, params, 1)
-        new_sig = Signature(parameters=params)
 
-        # and create the new init method
-        @with_signature(new_sig, func_name='__init__')
-        def init_fun(*args, **kwargs):
-            """
+        # and create the new init method. It directly has the appropriate signature, no need for a `with_signature`
+        # wrapper.
+        __init__ = _make_init_impl(params, field_names)
+        __init__.__doc__ = """
             The `__init__` method generated for you when you use `make_init`
             """
-            # 1. get 'self'
-            try:
-                # most of the time 'self' will be received like that
-                self = kwargs['self']
-            except IndexError:
-                self = args[0]
-
-            # 2. self-assign all fields
-            for field_name in field_names:
-                field_value = kwargs[field_name]
-                if field_value is not USE_FACTORY:
-                    # init the field with the provided value or the injected default value
-                    setattr(self, field_name, field_value)
-                else:
-                    # init the field with its factory, by just getting it
-                    getattr(self, field_name)
-
-        return init_fun
+        return __init__
 
     else:
         # B - function provided - expose a signature containing 'self' + the function params + fields
@@ -419,29 +541,42 @@ def create_init(fields,                     # type: Iterable[Field]
         field_names, _idx = _insert_fields_at_position(fields, params, 1)
 
         # then get the function signature
-        user_init_sig = signature(user_init_fun)
+        user_init_sig = _get_signature(user_init_fun)
 
         # Insert all parameters from the function except 'self'
-        if user_init_args_before:
-            mandatory_insert_idx, optional_insert_idx = 1, _idx
-        else:
-            mandatory_insert_idx, optional_insert_idx = _idx, len(params)
-
+        user_params = tuple(user_init_sig.parameters.values())[1:]
         fields_arg_found = False
-        for p in islice(user_init_sig.parameters.values(), 1, None):  # remove the 'self' argument
+        positional_only_params, mandatory_params, optional_params, trailing_params = [], [], [], []
+        for p in user_params:
             if inject_fields and p.name == 'fields':
                 # injected argument
                 fields_arg_found = True
                 continue
-            if p.default is p.empty:
+            if p.kind is Parameter.POSITIONAL_ONLY:
+                # always before the fields
+                positional_only_params.append(p)
+            elif p.kind is not Parameter.POSITIONAL_OR_KEYWORD:
+                # *args, keyword-only and **kwargs: always after the fields
+                trailing_params.append(p)
+            elif p.default is p.empty:
                 # mandatory
-                params.insert(mandatory_insert_idx, p)
-                mandatory_insert_idx += 1
-                optional_insert_idx += 1
+                mandatory_params.append(p)
             else:
                 # optional
-                params.insert(optional_insert_idx, p)
-                optional_insert_idx += 1
+                optional_params.append(p)
+
+        if user_init_args_before:
+            # before the mandatory fields, and before the optional fields
+            params[1:1] = mandatory_params
+            optional_insert_idx = _idx + len(mandatory_params)
+            params[optional_insert_idx:optional_insert_idx] = optional_params
+        else:
+            # after the mandatory fields, and after the optional fields
+            params[_idx:_idx] = mandatory_params
+            params.extend(optional_params)
+        if positional_only_params:
+            params[0:1] = [_SELF_PARAM.replace(kind=Parameter.POSITIONAL_ONLY)] + positional_only_params
+        params.extend(trailing_params)
 
         if inject_fields and not fields_arg_found:
             # 'fields' argument not found in __init__ signature: impossible to inject, raise an error
@@ -452,50 +587,282 @@ def create_init(fields,                     # type: Iterable[Field]
             raise ValueError("Error applying `@inject_fields` on `%s%s`: "
                              "no 'fields' argument is available in the signature." % (name, user_init_sig))
 
-        # replace the signature with the newly created one
-        new_sig = user_init_sig.replace(parameters=params)
-
-        # and create the new init method
-        if inject_fields:
-            @wraps(user_init_fun, new_sig=new_sig)
-            def __init__(self, *args, **kwargs):
-                """
-                The `__init__` method generated for you when you use `@inject_fields` on your `__init__`
-                """
-                # 1. remove all field values received from the outer signature
-                _fields = dict()
-                for f_name in field_names:
-                    _fields[f_name] = kwargs.pop(f_name)
-
-                # 2. inject our special variable
-                kwargs['fields'] = InjectedInitFieldsArg(**_fields)
-
-                # 3. call your __init__ method
-                return user_init_fun(self, *args, **kwargs)
-
+        # and create the new init method. It directly has the new signature and calls the user init function, no
+        # need for a `wraps` wrapper: only the metadata needs to be copied from the user init function.
+        if inject_fields and _is_trivial_injected_init(user_init_fun, user_params):
+            # the user init function only does `fields.init(self)`: assign the fields directly and do not call it
+            __init__ = _make_init_impl(params, field_names)
         else:
-            @wraps(user_init_fun, new_sig=new_sig)
-            def __init__(self, *args, **kwargs):
+            __init__ = _make_init_impl(params, field_names, user_init_fun=user_init_fun, user_params=user_params,
+                                       inject_fields=inject_fields)
+        update_wrapper(__init__, user_init_fun)
+        if __init__.__doc__ is None:
+            if inject_fields:
+                __init__.__doc__ = """
+                The `__init__` method generated for you when you use `@inject_fields` on your `__init__`
                 """
+            else:
+                __init__.__doc__ = """
                 The `__init__` method generated for you when you use `@init_fields`
                 or `make_init` with a non-None `post_init_fun` method.
                 """
-                # 1. self-assign all fields
-                for field_name in field_names:
-                    field_value = kwargs.pop(field_name)
-                    if field_value is not USE_FACTORY:
-                        # init the field with the provided value or the injected default value
-                        setattr(self, field_name, field_value)
-                    else:
-                        # init the field with its factory, by just getting it
-                        getattr(self, field_name)
-
-                # 2. call your post-init method
-                return user_init_fun(self, *args, **kwargs)
+        _set_annotations(__init__, params)
+        __init__.__wrapped__ = user_init_fun
+        __init__.__signature__ = user_init_sig.replace(parameters=params)
 
         return __init__
 
 
+def _is_trivial_injected_init(user_init_fun,  # type: Callable[[...], Any]
+                              user_params     # type: Tuple[Parameter, ...]
+                              ):
+    # type: (...) -> bool
+    """
+    Returns True if `user_init_fun`, decorated with `@inject_fields`, has signature `(self, fields)` and its body only
+    contains `fields.init(self)`. In that case the generated `__init__` can directly assign the fields, without creating
+    an `InjectedInitFieldsArg` nor calling `user_init_fun`.
+
+    The bytecode of `user_init_fun` is compared with the one of a reference function compiled with the same argument
+    names, so that this works on all python versions supporting `dis.get_instructions`.
+
+    :param user_init_fun:
+    :param user_params:
+    :return:
+    """
+    if get_instructions is None:
+        # python < 3.4: be conservative
+        return False
+
+    if len(user_params) != 1 or user_params[0].kind is not Parameter.POSITIONAL_OR_KEYWORD \
+            or user_params[0].default is not Parameter.empty:
+        return False
+
+    try:
+        code = user_init_fun.__code__
+    except AttributeError:
+        # not a python function
+        return False
+
+    if code.co_argcount != 2 or code.co_freevars or code.co_cellvars:
+        return False
+
+    self_name, fields_name = code.co_varnames[:2]
+    if fields_name != 'fields':
+        return False
+
+    try:
+        ref_code = _trivial_injected_init_codes[self_name]
+    except KeyError:
+        src = "def __init__(%s, fields):\n    fields.init(%s)\n" % (self_name, self_name)
+        namespace = dict()
+        exec(compile(src, "<pyfields trivial init>", "exec"), namespace)
+        ref_code = _trivial_injected_init_codes[self_name] = namespace['__init__'].__code__
+
+    if code.co_flags != ref_code.co_flags:
+        return False
+
+    # compare the instructions: line numbers, offsets and constant indices are ignored
+    return [(i.opname, i.argval) for i in get_instructions(code)] \
+        == [(i.opname, i.argval) for i in get_instructions(ref_code)]
+
+
+_trivial_injected_init_codes = dict()
+"""A cache of the code of the reference `fields.init(self)` functions, by name of the 'self' argument"""
+
+
+_signatures_cache = WeakKeyDictionary()
+"""A cache of the signatures of user-provided init functions, see `_get_signature`"""
+
+
+def _get_signature(f):
+    """
+    Returns `signature(f)`, using a cache: the same user init function may be used to create the `__init__` of several
+    classes, for example subclasses on python < 3.6. Signatures are immutable so they can be shared.
+
+    :param f:
+    :return:
+    """
+    try:
+        return _signatures_cache[f]
+    except KeyError:
+        sig = _signatures_cache[f] = signature(f)
+        return sig
+    except TypeError:
+        # not weakly referenceable (e.g. builtin callable): no cache
+        return signature(f)
+
+
+def _make_init_impl(params,              # type: List[Parameter]
+                    field_names,         # type: Tuple[str, ...]
+                    user_init_fun=None,  # type: Callable[[...], Any]
+                    user_params=(),      # type: Tuple[Parameter, ...]
+                    inject_fields=False  # type: bool
+                    ):
+    """
+    Generates the implementation of an `__init__` method self-assigning all fields in `field_names`, in straight-line
+    code: there is no loop on the fields, no dictionary lookup and no `setattr`/`getattr` call. Each field is assigned
+    through its public name, so that the descriptor of the actual class of `self` is used (it may be overridden in a
+    subclass).
+
+    The generated function directly has signature `params` (including default values and annotations), so all values
+    are received as local variables. If `user_init_fun` is not None, it is called at the end with the values of
+    `user_params`, its parameters (except the first one, 'self'). If `inject_fields` is True, the field values are not
+    assigned but are passed to `user_init_fun` in the `fields` argument, in an `InjectedInitFieldsArg`.
+
+    :param params:
+    :param field_names:
+    :param user_init_fun:
+    :param user_params:
+    :param inject_fields:
+    :return:
+    """
+    filename = "<pyfields init %s>" % ", ".join(field_names)
+
+    # the signature. Check it before generating the source code: this raises a `ValueError` for duplicate names or
+    # invalid parameter order (parameter names are checked by the `Parameter` constructor)
+    Signature(params)
+    for p in params:
+        if p.name.startswith(_RESERVED_PREFIX):
+            raise ValueError("Invalid argument name %r in the generated `__init__` method: names starting with %r are "
+                             "reserved by pyfields" % (p.name, _RESERVED_PREFIX))
+    args, defaults, kwdefaults = _make_args_src(params)
+
+    # only fields with a default value factory can receive USE_FACTORY: others do not need the check
+    factory_field_names = frozenset(p.name for p in params if p.default is USE_FACTORY)
+
+    # the body
+    body = []
+    injected_fields_arg_type = None
+    if inject_fields:
+        # do not assign the field values but inject our special variable
+        injected_fields_arg_type = _get_injected_fields_arg_type(field_names, factory_field_names)
+        body.append("fields = _pyfields_InjectedInitFieldsArg(%s)" % ", ".join(field_names))
+        field_names = ()
+
+    for field_name in field_names:
+        if field_name in factory_field_names:
+            body += ["if %s is not _pyfields_USE_FACTORY:" % field_name,
+                     "    # init the field with the provided value or the injected default value",
+                     "    self.%s = %s" % (field_name, field_name),
+                     "else:",
+                     "    # init the field with its factory, by just getting it",
+                     "    self.%s" % field_name]
+        else:
+            # init the field with the provided value or its default value
+            body.append("self.%s = %s" % (field_name, field_name))
+
+    if user_init_fun is not None:
+        # call the user's post-init method
+        user_args, _, _ = _make_args_src(user_params, for_call=True)
+        body.append("return _pyfields_user_init(%s)" % ", ".join(["self"] + user_args))
+    elif len(body) == 0:
+        body.append("pass")
+
+    src = "def __init__(%s):\n" % ", ".join(args)
+    src += "\n".join("    " + line for line in body) + "\n"
+    __init__ = _compile_with_closure(src, '__init__', filename, _pyfields_USE_FACTORY=USE_FACTORY,
+                                     _pyfields_user_init=user_init_fun,
+                                     _pyfields_InjectedInitFieldsArg=injected_fields_arg_type)
+
+    # set the default values and annotations
+    __init__.__defaults__ = tuple(defaults) or None
+    if kwdefaults:
+        __init__.__kwdefaults__ = kwdefaults
+    _set_annotations(__init__, params)
+
+    return __init__
+
+
+def _compile_with_closure(src,        # type: str
+                          fun_name,   # type: str
+                          filename,   # type: str
+                          **closure_vars
+                          ):
+    """
+    Compiles the definition of function `fun_name` in `src` and returns the function. The definition is compiled inside
+    an enclosing function receiving `closure_vars`, so that the generated function reads them from closure cells
+    rather than from its globals, which is faster. The names of `closure_vars` should start with `_RESERVED_PREFIX`,
+    so that they are not shadowed by the arguments of the generated function.
+
+    :param src:
+    :param fun_name:
+    :param filename:
+    :param closure_vars:
+    :return:
+    """
+    names = sorted(closure_vars)
+    outer_src = "def _make(%s):\n" % ", ".join(names)
+    outer_src += "".join("    %s\n" % line for line in src.splitlines())
+    outer_src += "    return %s\n" % fun_name
+
+    namespace = dict()
+    exec(compile(outer_src, filename, "exec"), namespace)
+    f = namespace['_make'](**closure_vars)
+    f.__qualname__ = fun_name
+    return f
+
+
+def _make_args_src(params,         # type: Iterable[Parameter]
+                   for_call=False  # type: bool
+                   ):
+    # type: (...) -> Tuple[List[str], List[Any], dict]
+    """
+    Returns the source code for the arguments of a function definition with parameters `params` (or of a call to such
+    a function if `for_call` is True), as a list. The default values are not in the source code, they are returned in
+    the list of positional defaults and the dict of keyword-only defaults.
+
+    :param params:
+    :param for_call:
+    :return:
+    """
+    args, defaults, kwdefaults = [], [], dict()
+    positional_only = star_found = False
+    for p in params:
+        if p.kind is not Parameter.POSITIONAL_ONLY and positional_only:
+            # end of the positional-only arguments
+            if not for_call:
+                args.append("/")
+            positional_only = False
+
+        if p.kind is Parameter.POSITIONAL_ONLY:
+            positional_only = True
+            args.append(p.name)
+        elif p.kind is Parameter.POSITIONAL_OR_KEYWORD:
+            args.append(p.name)
+        elif p.kind is Parameter.VAR_POSITIONAL:
+            star_found = True
+            args.append("*%s" % p.name)
+        elif p.kind is Parameter.KEYWORD_ONLY:
+            if not star_found and not for_call:
+                star_found = True
+                args.append("*")
+            args.append(("%s=%s" % (p.name, p.name)) if for_call else p.name)
+        else:  # VAR_KEYWORD
+            args.append("**%s" % p.name)
+
+        if p.default is not Parameter.empty:
+            if p.kind is Parameter.KEYWORD_ONLY:
+                kwdefaults[p.name] = p.default
+            else:
+                defaults.append(p.default)
+
+    if positional_only and not for_call:
+        args.append("/")
+
+    return args, defaults, kwdefaults
+
+
+def _set_annotations(f, params):
+    """
+    Sets the annotations of function `f` according to `params`.
+
+    :param f:
+    :param params:
+    :return:
+    """
+    f.__annotations__ = {p.name: p.annotation for p in params if p.annotation is not Parameter.empty}
+
+
 def _insert_fields_at_position(fields_to_insert,
                                params,
                                i,
@@ -509,40 +876,60 @@ def _insert_fields_at_position(fields_to_insert,
     :param field_names:
     :param i:
     :param params:
-    :return:
+    :return: a tuple (field_names, index after the last mandatory field). field_names is a tuple.
     """
-    if field_names is None:
-        field_names = []
-
-    initial_i = i
-    last_mandatory_idx = i
-    for _field in reversed(fields_to_insert):
+    # build the mandatory and optional parameters separately, and insert them all at once
+    mandatory_names, mandatory_params = [], []
+    optional_names, optional_params = [], []
+    for _field in fields_to_insert:
         # Is this field optional ?
         if _field.is_mandatory:
             # mandatory
-            where_to_insert = i
-            last_mandatory_idx += 1
             default = Parameter.empty
+            names, new_params = mandatory_names, mandatory_params
         elif _field.is_default_factory:
             # optional with a default value factory: place a specific symbol in the signature to indicate it
             default = USE_FACTORY
-            where_to_insert = last_mandatory_idx
+            names, new_params = optional_names, optional_params
         else:
             # optional with a default value
             default = _field.default
-            where_to_insert = last_mandatory_idx
+            names, new_params = optional_names, optional_params
 
         # Are there annotations on the field ?
-        annotation = _field.type_hint if _field.type_hint is not EMPTY else Parameter.empty
+        annotation = _field.type_hint
+        if annotation is EMPTY:
+            annotation = Parameter.empty
 
         # remember the list of field names for later use - but in the right order
-        field_names.insert(where_to_insert - initial_i, _field.name)
+        name = _field.name
+        names.append(name)
+
+        # finally create the new parameter for the signature, or reuse the one created for this field for another class
+        try:
+            new_param = _field_params_cache[_field]
+        except KeyError:
+            new_param = None
+
+        if new_param is None or new_param.name != name or new_param.default is not default \
+                or new_param.annotation is not annotation:
+            new_param = _field_params_cache[_field] = Parameter(name, kind=Parameter.POSITIONAL_OR_KEYWORD,
+                                                                default=default, annotation=annotation)
+        new_params.append(new_param)
+
+    if field_names is None:
+        field_names = tuple(mandatory_names + optional_names)
+    else:
+        field_names[0:0] = mandatory_names + optional_names
+        field_names = tuple(field_names)
+    params[i:i] = mandatory_params + optional_params
+
+    return field_names, i + len(mandatory_params)
 
-        # finally inject the new parameter in the signature
-        new_param = Parameter(_field.name, kind=Parameter.POSITIONAL_OR_KEYWORD, default=default, annotation=annotation)
-        params.insert(where_to_insert, new_param)
 
-    return field_names, last_mandatory_idx
+_field_params_cache = WeakKeyDictionary()
+"""A cache of the signature parameter created for each field by `_insert_fields_at_position` (parameters are immutable
+so they can be shared by all classes using the field)"""
 
 
 def pop_kwargs(kwargs,
@@ -71,10 +71,28 @@ def _instantiate(clazz):
 @pytest.mark.parametrize("type", ["python", "pyfields", "attrs", "dataclass"])
 def test_timers_instance(benchmark, type):
     clazz = _create_class_creator(type)()
+    # make sure that the `__init__` is already created (pyfields creates it on first access), so that only the
+    # instantiation is measured. See `test_timers_init_materialization` for the cost of the first access.
+    clazz(color='hello', height=50)
 
     benchmark(_instantiate(clazz))
 
 
+def _access_init(clazz):
+    return clazz.__init__
+
+
+@pytest.mark.parametrize("type", ["python", "pyfields", "attrs", "dataclass"])
+def test_timers_init_materialization(benchmark, type):
+    class_creator = _create_class_creator(type)
+
+    def _new_class():
+        # a new class for each round, so that each round measures the first access to its `__init__`
+        return (class_creator(),), dict()
+
+    benchmark.pedantic(_access_init, setup=_new_class, rounds=100)
+
+
 def _read_field(obj):
     return lambda: obj.color
 
@@ -5,7 +5,7 @@
 import pytest
 
 from typing import List, Optional
-from pyfields import field, inject_fields, MandatoryFieldInitError, make_init, autofields, autoclass
+from pyfields import field, inject_fields, MandatoryFieldInitError, make_init, autofields, autoclass, init_fields
 
 
 def _test_class_annotations():
@@ -209,3 +209,14 @@ def _test_autoclass3():
         height: int = field(default=50)
 
     return Foo
+
+
+def _test_init_kw_only_user_init():
+    class A(object):
+        a = field(default_factory=lambda obj: [])
+
+        @init_fields(a)
+        def __init__(self, b, *, c=2, d):
+            self.bcd = (b, c, d)
+
+    return A
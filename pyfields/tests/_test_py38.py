@@ -0,0 +1,15 @@
+#  Authors: Sylvain Marie <sylvain.marie@se.com>
+#
+#  Copyright (c) Schneider Electric Industries, 2019. All right reserved.
+from pyfields import field, init_fields
+
+
+def _test_init_positional_only_user_init():
+    class A(object):
+        a = field(default=1)
+
+        @init_fields
+        def __init__(self, b, /, c=2):
+            self.bc = (b, c)
+
+    return A
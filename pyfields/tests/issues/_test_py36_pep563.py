@@ -1,5 +1,5 @@
 from __future__ import annotations  # python 3.10 behaviour see https://www.python.org/dev/peps/pep-0563/
-from pyfields import field
+from pyfields import field, make_init
 
 
 def test_issue_73():
@@ -19,3 +19,21 @@ def test_issue_73_cross_ref():
     # note: we have to define the classes outside the function for the cross-ref to work
     # indeed typing.get_type_hints() will only access the globals of the defining module
     return A, B
+
+
+class ForwardRefInit:
+    bar: ForwardRefTarget = field(default=None)
+    __init__ = make_init()
+
+
+class ForwardRefGetField:
+    bar: ForwardRefTarget = field(default=None)
+
+
+class ForwardRefTarget:
+    pass
+
+
+def test_forward_ref_fields():
+    # note: the classes are defined outside the function so that the forward reference can be resolved
+    return ForwardRefInit, ForwardRefGetField, ForwardRefTarget
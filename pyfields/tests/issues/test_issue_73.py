@@ -72,3 +72,17 @@ def test_cross_referenced_class(str_hint, fix_in_class_field):
         # we can optionally check this now, but the mere fact that the above worked is already a proof
         assert A.bar.type_hint is B
         assert B.bar.type_hint is A
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="PEP563 is not supported in python < 3.7")
+def test_forward_ref_get_fields():
+    """Fields with a forward reference type hint are fixed when they are collected by get_fields or get_field"""
+    from inspect import signature
+    from pyfields import get_fields, get_field
+    from ._test_py36_pep563 import test_forward_ref_fields
+    ForwardRefInit, ForwardRefGetField, ForwardRefTarget = test_forward_ref_fields()
+
+    assert get_fields(ForwardRefInit)[0].type_hint is ForwardRefTarget
+    assert signature(ForwardRefInit.__init__).parameters['bar'].annotation is ForwardRefTarget
+
+    assert get_field(ForwardRefGetField, 'bar').type_hint is ForwardRefTarget
@@ -5,7 +5,7 @@ import sys
 
 import pytest
 
-from pyfields import autofields, field, FieldTypeError, Field, get_fields, autoclass
+from pyfields import autofields, field, FieldTypeError, Field, get_fields, autoclass, autoslots, copy_value
 from pyfields.core import NativeField
 
 
@@ -189,3 +189,90 @@ def test_autoclass():
     # hash
     my_set = {b2, b}
     assert Bar2('hey') in my_set
+
+
+def test_autoslots():
+    """ Tests that @autoslots creates a class with slots for the fields private names """
+
+    class Base(object):
+        __slots__ = ()
+
+        def greet(self):
+            return "hello"
+
+    @autoslots
+    class Foo(Base):
+        a = field(type_hint=int, check_type=True)
+        b = field(default_factory=copy_value([]))
+
+        def greet(self):
+            return super(Foo, self).greet() + " foo"
+
+        @property
+        def c(self):
+            return super().greet() if sys.version_info >= (3, 7) else None
+
+    assert Foo.__slots__ == ('_a', '_b', '__weakref__')
+    assert Foo.__name__ == 'Foo'
+
+    f = Foo()
+    assert not hasattr(f, '__dict__')
+    f.a = 1
+    assert f.a == 1
+    assert f.b == []
+    with pytest.raises(FieldTypeError):
+        f.a = '1'
+    with pytest.raises(AttributeError):
+        f.d = 0
+
+    # super() still works, with and without arguments
+    assert f.greet() == "hello foo"
+    if sys.version_info >= (3, 7):
+        assert f.c == "hello"
+
+    with pytest.raises(ValueError):
+        @autoslots
+        class Bar(object):
+            __slots__ = ()
+            a = field()
+
+
+def test_autoslots_inherited_dict():
+    """ Tests that @autoslots stores the field values in slots even if an ancestor provides a `__dict__` """
+
+    class Base(object):
+        pass
+
+    @autoslots
+    class Foo(Base):
+        a = field()
+        b = field(default=1, check_type=True, type_hint=int)
+
+    f = Foo()
+    assert hasattr(f, '__dict__')
+    f.a = 0
+    f.b = 2
+    assert (f.a, f.b) == (0, 2)
+    # the values are in the slots, not in the instance dict
+    assert (f._a, f._b) == (0, 2)
+    assert vars(f) == {}
+
+
+def test_autoslots_mangled_name():
+    """ Tests that @autoslots supports fields with a private (name-mangled) name """
+
+    @autoslots
+    class B(object):
+        __x = field(default=1)
+
+        def get_x(self):
+            return self.__x
+
+        def set_x(self, x):
+            self.__x = x
+
+    b = B()
+    assert b.get_x() == 1
+    b.set_x(2)
+    assert b.get_x() == 2
+    assert not hasattr(b, '__dict__')
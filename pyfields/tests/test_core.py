@@ -15,7 +15,9 @@ from valid8.base import InvalidValue
 from valid8.validation_lib import non_empty, Empty
 
 from pyfields import field, MandatoryFieldInitError, UnsupportedOnNativeFieldError, \
-    copy_value, copy_field, Converter, Field, ConversionError, ReadOnlyFieldError, FieldTypeError, make_init
+    copy_value, copy_field, Converter, Field, ConversionError, ReadOnlyFieldError, FieldTypeError, make_init, \
+    NoneError
+from pyfields.core import NativeField, DescriptorField
 
 
 @pytest.mark.parametrize('write_before_reading', [False, True], ids="write_before_reading={}".format)
@@ -126,6 +128,16 @@ def test_slots2():
     assert repr(WithSlots.__dict__['a']) == "<NativeField: %s>" % a_name
 
 
+def test_fields_have_no_dict():
+    """tests that all field classes declare `__slots__` so that field objects stay small"""
+    class Foo(object):
+        a = field()
+        b = field(type_hint=int, check_type=True)
+
+    for f in (Foo.__dict__['a'], Foo.__dict__['b'], NativeField(), DescriptorField()):
+        assert not hasattr(f, '__dict__')
+
+
 def test_default_factory():
     """"""
     class Foo(object):
@@ -160,6 +172,17 @@ def test_default_factory():
     assert g.c == [1, 'yes']
 
 
+@pytest.mark.parametrize("native", [False, True], ids="native={}".format)
+def test_default_changed_after_use(native):
+    """ Tests that changing the default value of a field after first use is taken into account """
+    class Foo(object):
+        a = field(default=1, native=native)
+
+    assert Foo().a == 1
+    Foo.__dict__['a'].default = 5
+    assert Foo().a == 5
+
+
 def test_type():
     """ Tests that when `type_hint` is provided and `validate_type` is explicitly set, it works as expected """
 
@@ -180,6 +203,37 @@ def test_type():
                                   "Instead, received a 'int': 1" % (qualname, str)
 
 
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="typing.Protocol is not available in python < 3.8")
+def test_type_any_and_protocol():
+    """ Tests that `Any` and protocols are checked with the type checker and not with a plain `isinstance` """
+    from typing import Any, Protocol
+    from pyfields.core import _isinstance_is_enough
+
+    class Greeter(Protocol):
+        def greet(self):
+            pass
+
+    assert _isinstance_is_enough(int)
+    assert not _isinstance_is_enough(Any)
+    assert not _isinstance_is_enough(Greeter)
+
+    # the light type checker used when no type checker is installed does not support `Any` nor protocols
+    pytest.importorskip("typeguard")
+
+    class Foo(object):
+        a = field(type_hint=Any, check_type=True)
+        g = field(type_hint=Greeter, check_type=True)
+
+    class Hello(object):
+        def greet(self):
+            pass
+
+    o = Foo()
+    o.a = 1
+    o.a = 'hello'
+    o.g = Hello()
+
+
 def test_type_multiple_tuple():
     """ Tests that when `type_hint` is provided and `validate_type` is explicitly set, it works as expected """
 
@@ -203,6 +257,110 @@ def test_type_multiple_tuple():
                                   "Instead, received a 'float': 1.1" % (qualname, msg)
 
 
+def test_type_missing():
+    """ Tests that when `check_type` is set but no type hint is available, an error is raised when setting non-None """
+
+    class Foo(object):
+        f = field(nonable=True, check_type=True)
+
+    o = Foo()
+    o.f = None
+    with pytest.raises(ValueError) as exc_info:
+        o.f = 1
+
+    if sys.version_info < (3, 0):
+        qualname = 'pyfields.tests.test_core.Foo.f'
+    else:
+        qualname = 'test_type_missing.<locals>.Foo.f'
+    assert str(exc_info.value).startswith("`check_type` is enabled on field '%s' but no type hint is available."
+                                          % qualname)
+
+
+def test_check_type_changed_after_use():
+    """ Tests that changing `check_type` on a field after it was first set is taken into account """
+
+    class Foo(object):
+        f = field(type_hint=str, check_type=True)
+
+    o = Foo()
+    o.f = 'hello'
+    with pytest.raises(FieldTypeError):
+        o.f = 1
+
+    Foo.__dict__['f'].check_type = False
+    o.f = 1
+    assert o.f == 1
+
+    Foo.__dict__['f'].check_type = True
+    with pytest.raises(FieldTypeError):
+        o.f = 2
+
+
+def test_type_hint_changed_after_use():
+    """ Tests that changing `type_hint` on a field after it was first set is taken into account """
+
+    class Foo(object):
+        f = field(check_type=True, nonable=True)
+
+    o = Foo()
+    o.f = None
+    with pytest.raises(ValueError):
+        o.f = 1
+
+    Foo.__dict__['f'].type_hint = int
+    o.f = 1
+    with pytest.raises(FieldTypeError):
+        o.f = 'hello'
+
+
+def test_read_only_changed_after_use():
+    """ Tests that changing `read_only` on a field after it was first set is taken into account """
+
+    class Foo(object):
+        f = field(native=False)
+
+    o = Foo()
+    o.f = 1
+
+    Foo.__dict__['f'].read_only = True
+    o2 = Foo()
+    o2.f = 1
+    with pytest.raises(ReadOnlyFieldError):
+        o2.f = 2
+
+
+def test_custom_setattr():
+    """ Tests that the values of descriptor fields go through the `__setattr__` of the class """
+
+    class Foo(object):
+        f = field(default=0, native=False)
+
+        def __setattr__(self, name, value):
+            object.__setattr__(self, 'last_set', name)
+            object.__setattr__(self, name, value)
+
+    o = Foo()
+    o.f = 1
+    assert o.last_set == '_f'
+    assert o.f == 1
+
+
+def test_nonable_changed_after_use():
+    """ Tests that changing `nonable` on a field after it was first set is taken into account """
+
+    class Foo(object):
+        f = field(nonable=False, native=False)
+
+    o = Foo()
+    o.f = 1
+    with pytest.raises(NoneError):
+        o.f = None
+
+    Foo.__dict__['f'].nonable = True
+    o.f = None
+    assert o.f is None
+
+
 try:
     from typing import Optional
     typing_present = True
@@ -253,6 +411,20 @@ def test_type_from_pep484_annotations():
     foo.field_with_defaults = 'hello'
 
 
+@pytest.mark.skipif(sys.version_info < (3, 6), reason="class member annotations are not allowed before python 3.6")
+def test_type_hints_cache():
+    """Type hints of a class are evaluated again when its annotations are modified in place """
+    from pyfields.typing_utils import get_type_hints
+
+    class Foo(object):
+        pass
+
+    Foo.__annotations__ = {'a': int}
+    assert get_type_hints(Foo) == {'a': int}
+    Foo.__annotations__['a'] = str
+    assert get_type_hints(Foo) == {'a': str}
+
+
 @pytest.mark.parametrize("case_nb", [1, 2, 3, 4, 5], ids="case_nb={}".format)
 def test_field_validators(case_nb):
     """ tests that `validators` functionality works correctly with several flavours of definition."""
@@ -455,6 +627,25 @@ def test_field_converters_decorator(explicit):
     assert foo.f == 3
 
 
+def test_validators_converters_added_after_use():
+    """Tests that validators and converters added after the field was first set are taken into account"""
+
+    class Foo(object):
+        f = field(native=False)
+
+    foo = Foo()
+    foo.f = -1
+
+    f_field = Foo.__dict__['f']
+    f_field.add_validator(lambda x: x >= 0)
+    with pytest.raises(ValidationError):
+        foo.f = -1
+
+    f_field.add_converter(abs)
+    foo.f = -2
+    assert foo.f == 2
+
+
 def test_converter_not_compliant_with_native_field():
     """tests that `native=True` can not be set when a validator is provided"""
     with pytest.raises(UnsupportedOnNativeFieldError):
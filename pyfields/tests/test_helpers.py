@@ -1,6 +1,6 @@
 import pytest
 
-from pyfields import field, get_field_values, get_fields, copy_field
+from pyfields import field, get_field_values, get_fields, copy_field, has_fields, copy_value
 from pyfields.core import PY36
 
 
@@ -35,3 +35,103 @@ def test_get_fields(a_first, public_only):
         assert fields == [('a', None), ('b', 2), ('c', 2)] if public_only else [('a', None), ('_d', 5), ('b', 2), ('c', 2)]
     else:
         assert fields == [('a', None), ('c', 2), ('b', 2)] if public_only else [('a', None), ('c', 2), ('b', 2), ('_d', 5)]
+
+
+def test_get_fields_cache():
+    """ Tests that `get_fields` results are cached, and that the cache is invalidated when the class changes """
+    class A(object):
+        a = field()
+
+    class B(A):
+        pass
+
+    fields = get_fields(A, _auto_fix_fields=not PY36)
+    assert get_fields(A) == fields
+    assert [f.name for f in get_fields(A, container_type=list)] == ['a']
+    assert [f.name for f in get_fields(B)] == ['a']
+
+    # attach a new field to the class
+    A.b = field()
+    assert [f.name for f in get_fields(A)] == ['a', 'b']
+    assert [f.name for f in get_fields(B)] == ['a', 'b']
+
+    # remove a field from the class
+    del A.a
+    assert [f.name for f in get_fields(A)] == ['b']
+    assert [f.name for f in get_fields(B)] == ['b']
+
+
+def test_has_fields():
+    class A(object):
+        a = field()
+
+    class B(A):
+        pass
+
+    class C(object):
+        a = 1
+
+    class Wrapper(object):
+        """ A custom descriptor giving access to a field """
+        def __init__(self, f):
+            self.f = f
+
+        def __get__(self, obj, objtype=None):
+            return self.f.__get__(obj, objtype)
+
+    class D(object):
+        a = Wrapper(field(name='a'))
+
+    assert has_fields(A)
+    assert has_fields(B)
+    assert not has_fields(B, include_inherited=False)
+    assert not has_fields(C)
+    assert has_fields(D)
+
+
+@pytest.mark.parametrize("deep", [False, True], ids="deep={}".format)
+def test_copy_value_immutable(deep):
+    """ Immutable values are not copied, mutable ones are """
+    t = (1, 'a', None)
+    assert copy_value(t, deep=deep)(None) is t
+
+    if deep:
+        t2 = (1, [])
+        assert copy_value(t2, deep=deep)(None)[1] is not t2[1]
+
+    class Foo(object):
+        a = field(default_factory=copy_value(t, deep=deep))
+        b = field(default_factory=copy_value([], deep=deep))
+
+    f, g = Foo(), Foo()
+    assert f.a is g.a
+    assert f.b == g.b == []
+    assert f.b is not g.b
+
+
+def test_copy_value_plain_data():
+    """ Deep copies of plain data are independent and preserve shared references, like deepcopy """
+    shared = [1]
+    val = [{'a': shared, 'b': shared}, (2, 'c')]
+    factory = copy_value(val)
+    v1, v2 = factory(None), factory(None)
+    assert v1 == v2 == val
+    assert v1 is not v2
+    assert v1[0]['a'] is not shared
+    assert v1[0]['a'] is v1[0]['b']
+
+
+def test_copy_value_snapshot():
+    """ Plain data is copied from a snapshot taken by `copy_value`, unless deep='deepcopy' """
+    val = [1]
+    factory = copy_value(val)
+    val.append(2)
+    assert factory(None) == [1]
+    assert factory.get_copied_value() == [1]
+
+    val = [1]
+    factory = copy_value(val, deep='deepcopy')
+    val.append(2)
+    assert factory(None) == [1, 2]
+    assert factory.get_copied_value() == [1, 2]
+    assert factory.clone_with_new_val([3]).deep == 'deepcopy'
@@ -210,3 +210,118 @@ def test_init_inheritance():
     # make sure that the 'a' field is ok
     b = B(a='h', b='w')
     assert b.a, b.b == ('h', 'w')
+
+
+def test_init_not_shared():
+    """Classes with the same shape share the generated code, but not the generated function """
+
+    def make_class():
+        class A(object):
+            a = field()
+            b = field(default=1)
+            __init__ = make_init()
+        return A
+
+    A1, A2 = make_class(), make_class()
+    a2 = A2(2)
+    assert A1.__init__ is not A2.__init__
+    assert A1.__init__.__code__ is A2.__init__.__code__
+    assert A2.__init__.__module__ == __name__
+    if sys.version_info >= (3, 3):
+        assert A2.__init__.__qualname__ == A2.__qualname__ + '.__init__'
+    assert (a2.a, a2.b) == (2, 1)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 0), reason="Keyword-only arguments not supported in python 2")
+def test_init_kw_only_user_init():
+    """The generated init can call a user init with keyword-only arguments """
+    from ._test_py36 import _test_init_kw_only_user_init
+    A = _test_init_kw_only_user_init()
+
+    a = A(1, d=4)
+    assert a.bcd == (1, 2, 4)
+    assert a.a == []
+    a = A(1, c=3, d=4, a=[0])
+    assert a.bcd == (1, 3, 4)
+    assert a.a == [0]
+    with pytest.raises(TypeError):
+        A(1, 2, 3)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="Positional-only arguments not supported in python < 3.8")
+def test_init_positional_only_user_init():
+    """The generated init can call a user init with positional-only arguments """
+    from ._test_py38 import _test_init_positional_only_user_init
+    A = _test_init_positional_only_user_init()
+
+    a = A(0, a=3)
+    assert (a.a, a.bc) == (3, (0, 2))
+    with pytest.raises(TypeError):
+        A(b=0)
+
+
+def test_init_var_positional_user_init():
+    """The generated init can call a user init with *args and **kwargs """
+    class A(object):
+        a = field(default=1)
+
+        @init_fields
+        def __init__(self, b, *args, **kwargs):
+            self.rest = (b, args, kwargs)
+
+    a = A(0, 2, 5, 6, c=3)
+    assert a.a == 2
+    assert a.rest == (0, (5, 6), {'c': 3})
+
+
+@pytest.mark.parametrize("inject", [False, True], ids="inject={}".format)
+def test_init_closure_names(inject):
+    """Fields and arguments can have the names used internally by the generated init """
+    class A(object):
+        USE_FACTORY = field(default_factory=lambda obj: 'factory')
+        InjectedInitFieldsArg = field(default=0)
+
+        if inject:
+            @inject_fields
+            def __init__(self, fields, user_init_fun=1):
+                fields.init(self)
+                self.b = user_init_fun
+        else:
+            @init_fields
+            def __init__(self, user_init_fun=1):
+                self.b = user_init_fun
+
+    a = A(user_init_fun=2)
+    assert (a.USE_FACTORY, a.InjectedInitFieldsArg, a.b) == ('factory', 0, 2)
+    a = A(USE_FACTORY='v', InjectedInitFieldsArg=1)
+    assert (a.USE_FACTORY, a.InjectedInitFieldsArg, a.b) == ('v', 1, 1)
+
+
+def test_init_reserved_names():
+    """Names starting with the reserved prefix are rejected """
+    class A(object):
+        _pyfields_user_init = field()
+        __init__ = make_init()
+
+    with pytest.raises(ValueError):
+        A(1)
+
+
+def test_init_duplicate_names():
+    """A user init argument with the name of a field raises a ValueError """
+    class A(object):
+        a = field()
+
+        @init_fields
+        def __init__(self, a):
+            pass
+
+    with pytest.raises(ValueError, match="duplicate parameter name"):
+        A(1)
+
+    class B(object):
+        b = field()
+        __init__ = make_init(b, b)
+
+    with pytest.raises(ValueError, match="duplicate parameter name"):
+        B(1)
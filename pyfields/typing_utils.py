@@ -193,11 +193,34 @@ if PY36:
 
         def get_type_hints(obj, globalns=None, localns=None):
             """
-            Fixed version of typing.get_type_hints to handle self forward references
+            Fixed version of typing.get_type_hints to handle self forward references.
+
+            The type hints of the last class are remembered, so that they are not evaluated again for each of its
+            fields when they are attached to it (`__set_name__`) or fixed. They are reused as long as the annotations of
+            the class and its ancestors do not change.
             """
+            global _last_cls_type_hints
             if globalns is None and localns is None and isinstance(obj, type):
-                localns = {obj.__name__: obj}
+                annotations_key = tuple(_annotations_key(c) for c in obj.__mro__)
+                if _last_cls_type_hints is not None:
+                    last_cls, last_annotations_key, last_hints = _last_cls_type_hints
+                    if last_cls is obj and last_annotations_key == annotations_key:
+                        return last_hints
+
+                hints = gth(obj, globalns=None, localns={obj.__name__: obj})
+                _last_cls_type_hints = obj, annotations_key, hints
+                return hints
+
             return gth(obj, globalns=globalns, localns=localns)
 
+        def _annotations_key(cls):
+            """Returns the current state of the annotations of `cls`, see `get_type_hints`"""
+            annotations = vars(cls).get('__annotations__')
+            return None if annotations is None else tuple(annotations.items())
+
+        _last_cls_type_hints = None
+        """A tuple (cls, annotations key, type hints) for the last class seen by `get_type_hints`. Only one class is
+        remembered, so that classes are not kept alive (their type hints may reference them)."""
+
     except ImportError:
         pass
@@ -4,9 +4,10 @@
 # License: 3-clause BSD, <https://github.com/smarie/python-pyfields/blob/master/LICENSE>
 import sys
 from collections import OrderedDict
+from copy import copy
 
 from valid8 import Validator, failure_raiser, ValidationError, ValidationFailure
-from valid8.base import getfullargspec as v8_getfullargspec, get_callable_name, is_mini_lambda
+from valid8.base import getfullargspec as v8_getfullargspec, get_callable_name, is_mini_lambda, raise_
 from valid8.common_syntax import FunctionDefinitionError, make_validation_func_callables
 from valid8.composition import _and_
 from valid8.entry_points import _add_none_handler
@@ -211,11 +212,22 @@ class FieldValidator(Validator):
                      error_type=None,  # type: Type[ValidationError]
                      help_msg=None,    # type: str
                      **ctx):
-        # do not use qualname here so as to save time.
-        super(FieldValidator, self).assert_valid(self.validated_field.name, value,
-                                                 error_type=error_type, help_msg=help_msg,
-                                                 # context info contains obj and field
-                                                 obj=obj, field=self.validated_field, **ctx)
+        # This is an inlined version of `Validator.assert_valid`, so as to save a few calls on each field write.
+        # context info contains obj and field
+        ctx['obj'] = obj
+        ctx['field'] = field = self.validated_field
+        if len(self.kw_context_args) > 0:
+            _ctx = copy(self.kw_context_args)
+            _ctx.update(ctx)
+            ctx = _ctx
+        try:
+            # perform validation with the main function (it will always be a failure raiser, no need to capture output)
+            self.main_function(value, **ctx)
+        except ValidationFailure as f:
+            # do not use qualname here so as to save time.
+            validation_error = self._create_validation_error(field.name, value, validation_outcome=f,
+                                                             error_type=error_type, help_msg=help_msg, **ctx)
+            raise_(validation_error)
 
 
 # --------------- converters
@@ -332,6 +344,23 @@ class ConverterWithFuncs(Converter):
             self.accepts = Converter.accepts.__get__(self, ConverterWithFuncs)
 
 
+_default_accepts = getattr(Converter.accepts, '__func__', Converter.accepts)
+"""The default `Converter.accepts` function (the underlying function in python 2)"""
+
+
+def accepts_all_values(converter  # type: Converter
+                       ):
+    # type: (...) -> bool
+    """
+    Returns `True` if the `accepts` method of `converter` is the default one from `Converter`, that accepts all values.
+    In that case there is no need to call it before trying to convert.
+
+    :param converter:
+    :return:
+    """
+    return getattr(converter.accepts, '__func__', None) is _default_accepts
+
+
 if use_type_hints:
     # --------------converter type hints
     # 1. the lowest-level user or 3d party-provided validation functions
@@ -409,14 +438,19 @@ def make_3params_callable(f,                    # type: Union[ValidationFunc, Co
         def new_f_with_3_args(obj, field, value):
             return f(value)
 
+        # remember the base function so that callers can skip this wrapper (see `get_base_callable`)
+        new_f_with_3_args.__base_callable__ = f, 1
+
     elif nbargs == 2:
         # `f(obj, val)`
         def new_f_with_3_args(obj, field, value):
             return f(obj, value)
 
+        new_f_with_3_args.__base_callable__ = f, 2
+
     else:
         # `f(obj, field, val, *opt_args, **ctx)`
-        new_f_with_3_args = f
+        return f
 
     # preserve the name
     new_f_with_3_args.__name__ = get_callable_name(f)
@@ -424,6 +458,23 @@ def make_3params_callable(f,                    # type: Union[ValidationFunc, Co
     return new_f_with_3_args
 
 
+def get_base_callable(f  # type: Callable[[Any, 'Field', Any], Any]
+                      ):
+    # type: (...) -> Tuple[Callable, int]
+    """
+    Returns a tuple `(base_f, nbargs)` where `base_f` is the callable wrapped by `f` if `f` was created by
+    `make_3params_callable`, and `nbargs` is the number of arguments it expects: 1 for `(val)`, 2 for `(obj, val)` and
+    3 for `(obj, field, val)`. Calling `base_f` directly saves one call.
+
+    :param f: a callable with signature `(obj, field, val)`
+    :return:
+    """
+    try:
+        return f.__base_callable__
+    except AttributeError:
+        return f, 3
+
+
 JOKER_STR = '*'
 """String used in converter definition dict entries or tuples, to indicate that the converter accepts everything"""
 